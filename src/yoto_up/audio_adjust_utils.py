@@ -3,6 +3,12 @@ import tempfile
 import numpy as np
 from pydub import AudioSegment
 
+def _to_int16(audio: np.ndarray) -> np.ndarray:
+    """Scale float audio (-1..1) to clipped int16, reusing one scratch array for scale and clip."""
+    scaled = np.multiply(audio, 32767, dtype=np.float32)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return scaled.astype(np.int16)
+
 def save_adjusted_audio(audio: np.ndarray, framerate: int, ext: str, orig_path: str, gain_db: float) -> str:
     """
     Save the adjusted audio (with gain applied) to a temporary file.
@@ -13,7 +19,7 @@ def save_adjusted_audio(audio: np.ndarray, framerate: int, ext: str, orig_path:
     base = os.path.splitext(os.path.basename(orig_path))[0]
     if ext == '.wav':
         # Scale to int16
-        audio_int16 = np.clip(audio * 32767, -32768, 32767).astype(np.int16)
+        audio_int16 = _to_int16(audio)
         temp_path = os.path.join(temp_dir, f"{base}_adj_{int(gain_db*10)}.wav")
         import wave
         with wave.open(temp_path, 'wb') as wf:
@@ -25,7 +31,7 @@ def save_adjusted_audio(audio: np.ndarray, framerate: int, ext: str, orig_path:
     elif ext == '.mp3':
         temp_path = os.path.join(temp_dir, f"{base}_adj_{int(gain_db*10)}.mp3")
         # Convert to pydub AudioSegment
-        audio_int16 = np.clip(audio * 32767, -32768, 32767).astype(np.int16)
+        audio_int16 = _to_int16(audio)
         seg = AudioSegment(
             audio_int16.tobytes(),
             frame_rate=framerate,
@@ -919,6 +919,8 @@ def main(page):
     'intro_outro_seconds_control': intro_seconds,
     'intro_outro_threshold_control': similarity_threshold,
     'gain_adjusted_files': gain_adjusted_files,
+    'waveform_cache': waveform_cache,
+    'audio_adjust_utils': audio_adjust_utils,
         'start_btn': start_btn,
         'stop_btn': stop_btn,
         'remove_uploaded_btn': remove_uploaded_btn,
@@ -43,6 +43,7 @@ STAMPS_DIR = _BASE_DATA_DIR / ".stamps"
 USER_ICONS_DIR = _BASE_DATA_DIR / ".user_icons"
 VERSIONS_DIR = _BASE_DATA_DIR / ".card_versions"
 PLAYLISTS_FILE = _BASE_DATA_DIR / "playlists.json"
+WAVEFORM_CACHE_DIR = _BASE_CACHE_DIR / "waveforms"
 
 # Convenience helpers
 def ensure_parents(path: Path):
@@ -107,6 +108,10 @@ try:
     USER_ICONS_DIR.mkdir(parents=True, exist_ok=True)
 except Exception:
     pass
+try:
+    WAVEFORM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+except Exception:
+    pass
 
 
 
@@ -144,6 +149,7 @@ __all__ = [
     "STAMPS_DIR",
     "VERSIONS_DIR",
     "PLAYLISTS_FILE",
+    "WAVEFORM_CACHE_DIR",
     "FLET_APP_STORAGE_DATA",
     "ensure_parents",
     "atomic_write",
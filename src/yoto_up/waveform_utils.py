@@ -1,20 +1,127 @@
 import os
-import io
-import base64
+import hashlib
 import numpy as np
 import contextlib
 import tempfile
+import threading
 import wave
 from concurrent.futures import ThreadPoolExecutor
 
+from yoto_up.paths import WAVEFORM_CACHE_DIR
+
+try:
+    import libloudness
+except ImportError:
+    libloudness = None
+
+# pyloudnorm meters by sample rate; building one designs the K-weighting filters
+_LUFS_METERS = {}
+
+
+def integrated_lufs(audio, framerate):
+    """
+    Integrated loudness of a mono float signal in LUFS.
+    Uses libloudness when installed, otherwise pyloudnorm.
+    Returns None if loudness cannot be measured (no meter, too short, or silent).
+    """
+    lufs = None
+    if libloudness is not None:
+        try:
+            lufs = float(libloudness.integrated_loudness(audio, framerate))
+        except Exception:
+            lufs = None
+    if lufs is None:
+        try:
+            import pyloudnorm as pyln
+            meter = _LUFS_METERS.get(framerate)
+            if meter is None:
+                meter = _LUFS_METERS[framerate] = pyln.Meter(framerate)
+            lufs = float(meter.integrated_loudness(audio))
+        except Exception:
+            return None
+    # fully gated (silent) signals come back as -inf
+    return lufs if np.isfinite(lufs) else None
+
+# bump when the stored peaks/stats change meaning so older summaries are ignored
+_SUMMARY_VERSION = 2
+
+
+def _file_key(filepath):
+    """(path, mtime_ns, size) identifying one version of a file, or just the path if it can't be stat'd."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return filepath
+    return (filepath, st.st_mtime_ns, st.st_size)
+
+
+def _summary_path(filepath, n_cols):
+    key = _file_key(filepath)
+    if not isinstance(key, tuple):
+        return None
+    ident = f"{_SUMMARY_VERSION}|{os.path.abspath(filepath)}|{key[1]}|{key[2]}|{n_cols}"
+    return WAVEFORM_CACHE_DIR / f"{hashlib.blake2b(ident.encode(), digest_size=16).hexdigest()}.npz"
+
+
+def load_waveform_summary(filepath, n_cols):
+    """
+    Load the peaks and stats saved by save_waveform_summary for this exact file version.
+    Returns (mins, maxs, max_amp, avg_amp, lufs, framerate, n_samples) or None.
+    """
+    path = _summary_path(filepath, n_cols)
+    if path is None or not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            max_amp, avg_amp, lufs, framerate, n_samples = data['stats'].tolist()
+            return (data['mins'], data['maxs'], max_amp, avg_amp,
+                    lufs if np.isfinite(lufs) else None, int(framerate), int(n_samples))
+    except Exception:
+        return None
+
+
+def save_waveform_summary(filepath, n_cols, mins, maxs, max_amp, avg_amp, lufs, framerate, n_samples):
+    """
+    Persist a file's per-column peaks and stats (a few KB) under WAVEFORM_CACHE_DIR,
+    keyed by (path, mtime, size), so later sessions can show it without decoding.
+    """
+    path = _summary_path(filepath, n_cols)
+    if path is None:
+        return
+    stats = np.array([max_amp, avg_amp, np.nan if lufs is None else lufs, framerate, n_samples], dtype=np.float64)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, mins=mins, maxs=maxs, stats=stats)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+
+# guards waveform_cache inserts made from batch_audio_stats' worker threads
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_stats(waveform_cache, key, filepath, result):
+    """Store `result` under `key`, dropping entries for older versions of the same file."""
+    with _CACHE_LOCK:
+        for old in [k for k in waveform_cache if k == filepath or (isinstance(k, tuple) and k[0] == filepath)]:
+            del waveform_cache[old]
+        waveform_cache[key] = result
+    return result
+
+
 def audio_stats(filepath, waveform_cache):
     """
     Calculate waveform, max amplitude, average amplitude, LUFS, extension, and filepath for an audio file.
-    Uses cache if available.
+    Uses cache if available; entries are keyed by (path, mtime, size) so edited files are re-read,
+    and only the newest version of each file is kept.
     Returns (audio, max_amp, avg_amp, lufs, ext, filepath)
     """
-    if filepath in waveform_cache:
-        return waveform_cache[filepath]
+    key = _file_key(filepath)
+    if key in waveform_cache:
+        return waveform_cache[key]
     ext = os.path.splitext(filepath)[1].lower()
     try:
         audio = None
@@ -33,26 +140,31 @@ def audio_stats(filepath, waveform_cache):
                 else:
                     dtype = np.int16
                 audio = np.frombuffer(frames, dtype=dtype)
+                # Downmix/convert straight to a fresh float32 array, then normalize in place
                 if nchannels > 1:
-                    audio = audio.reshape(-1, nchannels).mean(axis=1)
-                # Normalize
+                    audio = audio.reshape(-1, nchannels).mean(axis=1, dtype=np.float32)
+                else:
+                    audio = audio.astype(np.float32)
                 if dtype == np.int16:
-                    audio = audio.astype(np.float32) / 32768.0
+                    audio *= 1 / 32768.0
                 elif dtype == np.uint8:
-                    audio = (audio.astype(np.float32) - 128) / 128.0
+                    audio -= 128
+                    audio *= 1 / 128.0
         elif ext == '.mp3':
             try:
                 from pydub import AudioSegment
                 audio_seg = AudioSegment.from_file(filepath, format='mp3')
                 samples = np.array(audio_seg.get_array_of_samples())
                 if audio_seg.channels > 1:
-                    samples = samples.reshape((-1, audio_seg.channels)).mean(axis=1)
-                audio = samples.astype(np.float32)
+                    audio = samples.reshape((-1, audio_seg.channels)).mean(axis=1, dtype=np.float32)
+                else:
+                    audio = samples.astype(np.float32)
                 # Normalize
                 if audio_seg.sample_width == 2:
-                    audio = audio / 32768.0
+                    audio *= 1 / 32768.0
                 elif audio_seg.sample_width == 1:
-                    audio = (audio - 128) / 128.0
+                    audio -= 128
+                    audio *= 1 / 128.0
                 framerate = audio_seg.frame_rate
             except Exception:
                 try:
@@ -63,29 +175,22 @@ def audio_stats(filepath, waveform_cache):
         else:
             return None, None, None, None, None, None
         if audio is None or len(audio) == 0:
-            result = (None, None, None, None, ext, filepath)
-            waveform_cache[filepath] = result
-            return result
-        # Remove DC offset and check for silence
-        audio = audio - np.mean(audio)
-        if np.allclose(audio, 0):
+            return _cache_stats(waveform_cache, key, filepath, (None, None, None, None, ext, filepath))
+        # Remove DC offset, then take both amplitude stats from one |audio| pass
+        audio = audio.astype(np.float32, copy=False)
+        audio -= np.mean(audio)
+        abs_audio = np.abs(audio)
+        max_amp = float(abs_audio.max())
+        avg_amp = float(abs_audio.mean())
+        del abs_audio
+        # silent (all within np.allclose's default atol of zero)
+        if max_amp <= 1e-8:
             lufs = None
         else:
-            try:
-                import pyloudnorm as pyln
-                meter = pyln.Meter(framerate)
-                lufs = float(meter.integrated_loudness(audio))
-            except Exception:
-                lufs = None
-        max_amp = float(np.max(np.abs(audio)))
-        avg_amp = float(np.mean(np.abs(audio)))
-        result = (audio, max_amp, avg_amp, lufs, ext, filepath)
-        waveform_cache[filepath] = result
-        return result
+            lufs = integrated_lufs(audio, framerate)
+        return _cache_stats(waveform_cache, key, filepath, (audio, max_amp, avg_amp, lufs, ext, filepath))
     except Exception:
-        result = (None, None, None, None, None, None)
-        waveform_cache[filepath] = result
-        return result
+        return _cache_stats(waveform_cache, key, filepath, (None, None, None, None, None, None))
 
 def batch_audio_stats(files, waveform_cache, progress_callback=None):
     """
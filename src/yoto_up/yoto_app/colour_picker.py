@@ -1,14 +1,12 @@
 import flet as ft
-import os
 import math
 import colorsys
 from PIL import Image
 from loguru import logger
 import uuid
+import io
+import base64
 import threading
-from pathlib import Path
-
-from .icon_import_helpers import get_base64_from_path
 
 class ColourPicker:
     def __init__(self, current_color='#000000', wheel_size=280, saved_dir=None, on_color_selected=None, loading_dialog=None):
@@ -17,7 +15,6 @@ class ColourPicker:
         self.saved_dir = saved_dir or '.'
         self.color_picker_dialog = None
         self.on_color_selected = on_color_selected
-        self._temp_wheel_files = set()
         self.loading_dialog = loading_dialog
 
 
@@ -31,11 +28,8 @@ class ColourPicker:
         return f"#{r:02X}{g:02X}{b:02X}"
 
     def _make_color_wheel_image(self, val):
+        """Render the HSV wheel at brightness `val` and return it as a base64 PNG (None on failure)."""
         try:
-            import tempfile
-            tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            path = tmp.name
-            tmp.close()
             size = self.wheel_size
             cx = cy = size / 2.0
             radius = size / 2.0
@@ -77,9 +71,9 @@ class ColourPicker:
                             img.putpixel((x, y), (int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255), 255))
                         else:
                             img.putpixel((x, y), (0, 0, 0, 0))
-            img.save(path, format='PNG')
-            self._temp_wheel_files.add(path)
-            return path
+            buf = io.BytesIO()
+            img.save(buf, format='PNG', compress_level=1)
+            return base64.b64encode(buf.getvalue()).decode()
         except Exception as ex:
             return None
 
@@ -105,8 +99,7 @@ class ColourPicker:
         preview = ft.Container(width=48, height=48, bgcolor=self.current_color, border_radius=6, border=ft.border.all(1, "#888888"))
         value_slider = ft.Slider(min=0.0, max=1.0, value=1, divisions=100, label="Value (Brightness)", on_change=None)
         # Generate initial wheel image and set src
-        initial_wheel_path = self._make_color_wheel_image(value_slider.value)
-        wheel_img = ft.Image(src_base64=get_base64_from_path(Path(initial_wheel_path)), width=self.wheel_size, height=self.wheel_size)
+        wheel_img = ft.Image(src_base64=self._make_color_wheel_image(value_slider.value), width=self.wheel_size, height=self.wheel_size)
         # Debounce timer for HSV changes
         self._debounce_timer = None
 
@@ -237,13 +230,9 @@ class ColourPicker:
             if self.on_color_selected:
                 self.on_color_selected(hexv)
             # Regenerate and update wheel image on any HSV change
-            p = self._make_color_wheel_image(v)
-            if p and os.path.exists(p):
-                wheel_img.src = p
-                wheel_img.update()
-            else:
-                wheel_img.src = None
-                wheel_img.update()
+            # the wheel is encoded in memory; no temp PNG per brightness change
+            wheel_img.src_base64 = self._make_color_wheel_image(v)
+            wheel_img.update()
             try:
                 if page:
                     page.update()
@@ -315,15 +304,7 @@ class ColourPicker:
         return self.color_picker_dialog
 
     def close_dialog(self, page=None):
-        # Clean up temp wheel images
         logger.debug("Closing picker dialog")
-        for f in getattr(self, '_temp_wheel_files', []):
-            try:
-                if os.path.exists(f):
-                    os.remove(f)
-            except Exception:
-                pass
-        self._temp_wheel_files.clear()
         
 
         # Reopen caller dialog (e.g. stamp dialog) if provided and a page is available
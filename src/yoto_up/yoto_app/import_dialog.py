@@ -1,24 +1,119 @@
 import os
 import json
+import concurrent.futures
+import math
 import tempfile
+import threading
 import base64
 import io
-from collections import Counter
 
 import flet as ft
+import numpy as np
 from loguru import logger
 from PIL import Image
 import subprocess
 import sys
 import platform
 import io as _io
+from .pixel_grid import image_to_np, np_to_pixels, resize_nearest
 from yoto_up.paths import STAMPS_DIR
 
+try:
+    # optional SIMD resampler; Pillow is used when it is not installed
+    import pic_scale
+except ImportError:
+    pic_scale = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Use centralized STAMPS_DIR from paths.py (absolute Path-like)
 stamps_dir = str(STAMPS_DIR)
 
 IMPORT_DIALOG = None
 
+# width available to the tile preview inside the dialog
+PREVIEW_WIDTH = 680
+
+
+def _tile_atlas(tiles, max_width, gap=6):
+    """Lay `tiles` (RGBA images, None for a blank cell) out row by row in one transparent image.
+
+    Every tile gets a square cell sized to the largest tile, so the layout matches the
+    old wrapped row of individual thumbnails.
+    """
+    cell = max((max(t.width, t.height) for t in tiles if t is not None), default=1) + gap
+    per_row = max(1, min(len(tiles), (max_width + gap) // cell))
+    n_rows = -(-len(tiles) // per_row)
+    atlas = np.zeros((n_rows * cell - gap, per_row * cell - gap, 4), dtype=np.uint8)
+    for i, t in enumerate(tiles):
+        if t is None:
+            continue
+        r, c = divmod(i, per_row)
+        a = np.asarray(t.convert('RGBA'))
+        atlas[r * cell:r * cell + a.shape[0], c * cell:c * cell + a.shape[1]] = a
+    return Image.fromarray(atlas, 'RGBA')
+
+
+def _tile_to_np(im):
+    """Pack an imported tile as ARGB uint32: alpha >= 128 becomes opaque, anything else transparent (0)."""
+    a = image_to_np(im)
+    return np.where((a >> 24) >= 128, a | 0xFF000000, 0).astype(np.uint32)
+
+
+def _most_common_row(samples):
+    """Most frequent row of a (n, c) sample array as a tuple of ints; ties go to the one seen first."""
+    uniq, first, counts = np.unique(samples, axis=0, return_index=True, return_counts=True)
+    best = np.flatnonzero(counts == counts.max())
+    return tuple(int(v) for v in uniq[best[np.argmin(first[best])]])
+
+
+def _write_stamp_json(outp, payload):
+    """Write one imported stamp file; returns True on success and logs failures."""
+    try:
+        if orjson is not None:
+            with open(outp, 'wb') as fh:
+                fh.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(outp, 'w', encoding='utf-8') as fh:
+                json.dump(payload, fh, indent=2)
+        return True
+    except Exception as ex:
+        logger.exception(f"Failed writing stamp file {outp}: {ex}")
+        return False
+
+
+def _lanczos_resize(img, size, plans=None):
+    """LANCZOS-resize `img` to `size`, through pic_scale when available.
+
+    Pass a dict as `plans` to reuse one pic_scale Plan (and its filter weights) per
+    (mode, source size, target size) across a batch of same-shaped images.
+    """
+    if pic_scale is not None:
+        try:
+            # pic_scale only handles RGB/RGBA; palette and greyscale tiles go through RGBA
+            src = img if img.mode in ('RGB', 'RGBA') else img.convert('RGBA')
+            if plans is not None:
+                key = (src.mode, src.size, tuple(size))
+                plan = plans.get(key)
+                if plan is None:
+                    plan = pic_scale.Plan(src_size=src.size, dst_size=tuple(size), mode=src.mode, resampling=pic_scale.Resampling.LANCZOS)
+                    plans[key] = plan
+                return plan.resize(src)
+            return pic_scale.resize(src, size, pic_scale.Resampling.LANCZOS)
+        except Exception:
+            logger.debug("pic_scale resize failed; falling back to Pillow")
+    try:
+        resample_filter = Image.Resampling.LANCZOS
+    except Exception:
+        try:
+            resample_filter = Image.LANCZOS
+        except Exception:
+            resample_filter = Image.BICUBIC
+    return img.resize(size, resample=resample_filter)
+
 
 def open_import_dialog(editor, ev):
     """Show the import sprite-sheet dialog. This is extracted from stamp_dialog so it can be used independently.
@@ -88,153 +183,34 @@ def open_import_dialog(editor, ev):
         supporting multiple pixel formats and alpha handling. Returns None if tile appears empty.
         """
         try:
-            w2, h2 = im.size
-            px = im.load()
-
-            def to_rgba(v):
-                try:
-                    if isinstance(v, tuple):
-                        if len(v) >= 4:
-                            return (int(v[0]), int(v[1]), int(v[2]), int(v[3]))
-                        elif len(v) == 3:
-                            return (int(v[0]), int(v[1]), int(v[2]), 255)
-                        elif len(v) == 2:
-                            return (int(v[0]), int(v[0]), int(v[0]), int(v[1]))
-                    elif isinstance(v, (int, float)):
-                        iv = int(v)
-                        return (iv, iv, iv, 255)
-                except Exception:
-                    pass
-                return (0, 0, 0, 255)
-
-            def to_rgb3(v):
-                r, g, b, a = to_rgba(v)
-                return (r, g, b)
-
-            # quick alpha detection
-            has_alpha = False
-            for yy in range(min(4, h2)):
-                for xx in range(min(4, w2)):
-                    try:
-                        if to_rgba(px[xx, yy])[3] < 255:
-                            has_alpha = True
-                            break
-                    except Exception:
-                        pass
-                if has_alpha:
-                    break
-
-            if has_alpha:
-                top = bottom = left = right = None
-                for yy in range(h2):
-                    row_has = False
-                    for xx in range(w2):
-                        try:
-                            r, g, b, a = to_rgba(px[xx, yy])
-                            if a >= alpha_thresh:
-                                row_has = True
-                                break
-                        except Exception:
-                            pass
-                    if row_has and top is None:
-                        top = yy
-                    if row_has:
-                        bottom = yy
-                for xx in range(w2):
-                    col_has = False
-                    for yy in range(h2):
-                        try:
-                            r, g, b, a = to_rgba(px[xx, yy])
-                            if a >= alpha_thresh:
-                                col_has = True
-                                break
-                        except Exception:
-                            pass
-                    if col_has and left is None:
-                        left = xx
-                    if col_has:
-                        right = xx
-                if top is None:
-                    return None
-                return (left, top, right + 1, bottom + 1)
+            arr = np.asarray(im.convert('RGBA'))
+            h2, w2 = arr.shape[:2]
+            if w2 == 0 or h2 == 0:
+                return None
 
-            # no alpha path: sample border colour and find differing pixels
-            border_samples = []
-            for xx in range(w2):
-                try:
-                    border_samples.append(to_rgb3(px[xx, 0]))
-                except Exception:
-                    pass
-                try:
-                    border_samples.append(to_rgb3(px[xx, h2 - 1]))
-                except Exception:
-                    pass
-            for yy in range(h2):
-                try:
-                    border_samples.append(to_rgb3(px[0, yy]))
-                except Exception:
-                    pass
-                try:
-                    border_samples.append(to_rgb3(px[w2 - 1, yy]))
-                except Exception:
-                    pass
-            if border_samples:
-                bgc = Counter(border_samples).most_common(1)[0][0]
+            # quick alpha detection on the top-left 4x4 block
+            if (arr[:4, :4, 3] < 255).any():
+                mask = arr[..., 3] >= alpha_thresh
             else:
-                bgc = (255, 255, 255)
-
-            def color_diff_sq(a, b):
-                return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
-
-            top = bottom = left = right = None
-            for yy in range(h2):
-                row_has = False
-                for xx in range(w2):
-                    try:
-                        col = to_rgb3(px[xx, yy])
-                        if color_diff_sq(col, bgc) > (tol * tol):
-                            row_has = True
-                            break
-                    except Exception:
-                        pass
-                if row_has and top is None:
-                    top = yy
-                if row_has:
-                    bottom = yy
-            for xx in range(w2):
-                col_has = False
-                for yy in range(h2):
-                    try:
-                        col = to_rgb3(px[xx, yy])
-                        if color_diff_sq(col, bgc) > (tol * tol):
-                            col_has = True
-                            break
-                    except Exception:
-                        pass
-                if col_has and left is None:
-                    left = xx
-                if col_has:
-                    right = xx
-            if top is None:
+                # no alpha path: sample border colour (top/bottom pairs, then left/right pairs)
+                # and find differing pixels
+                rgb = arr[..., :3]
+                border = np.concatenate([
+                    np.stack([rgb[0], rgb[-1]], axis=1).reshape(-1, 3),
+                    np.stack([rgb[:, 0], rgb[:, -1]], axis=1).reshape(-1, 3),
+                ])
+                bgc = _most_common_row(border)
+                diff = rgb.astype(np.int32) - np.array(bgc, dtype=np.int32)
+                mask = (diff * diff).sum(axis=-1) > tol * tol
+
+            rows = np.flatnonzero(mask.any(axis=1))
+            cols = np.flatnonzero(mask.any(axis=0))
+            if not rows.size:
                 return None
-            return (left, top, right + 1, bottom + 1)
+            return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
         except Exception:
             return None
 
-    def _to_rgb3_from_value(v):
-        try:
-            if isinstance(v, tuple):
-                if len(v) >= 3:
-                    return (int(v[0]), int(v[1]), int(v[2]))
-                elif len(v) == 2:
-                    return (int(v[0]), int(v[0]), int(v[0]))
-            elif isinstance(v, (int, float)):
-                iv = int(v)
-                return (iv, iv, iv)
-        except Exception:
-            pass
-        return (255, 255, 255)
-
     def _make_bg_transparent(im, tol=20):
         """Return a copy of im with pixels similar to the corner/background color set transparent.
         Only pixels connected to the image border that are similar to the detected background
@@ -245,97 +221,46 @@ def open_import_dialog(editor, ev):
         try:
             if im is None:
                 return im
-            w3, h3 = im.size
-
-            # collect corner samples then pick the most common as background colour
-            pts = [(0, 0), (w3 - 1, 0), (0, h3 - 1), (w3 - 1, h3 - 1)] if w3 > 0 and h3 > 0 else []
-            corners = []
-            for (cx, cy) in pts:
-                try:
-                    val = im.getpixel((cx, cy))
-                    corners.append(_to_rgb3_from_value(val))
-                except Exception:
-                    pass
-            bgc = Counter(corners).most_common(1)[0][0] if corners else (255, 255, 255)
-
-            def similar_col_rgb(a, b, tol=tol):
-                return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2) <= (tol * tol)
-
             # Work on an RGBA copy
-            tc = im.convert('RGBA').copy()
-            tc_px = tc.load()
+            arr = np.array(im.convert('RGBA'))
+            h3, w3 = arr.shape[:2]
+            if w3 == 0 or h3 == 0:
+                return Image.fromarray(arr, 'RGBA')
 
-            # visited mask for flood-fill (0 = unseen, 1 = background-connected)
-            visited = [[0] * w3 for _ in range(h3)]
+            # corner samples (tl, tr, bl, br); the most common is the background, first seen wins ties
+            bgc = _most_common_row(arr[[0, 0, -1, -1], [0, -1, 0, -1], :3])
 
-            # stack for flood-fill; seed with border pixels that match bgc
-            stack = []
-            for x in range(w3):
-                try:
-                    col = _to_rgb3_from_value(tc_px[x, 0])
-                    if similar_col_rgb(col, bgc):
-                        stack.append((x, 0))
-                        visited[0][x] = 1
-                except Exception:
-                    pass
-                try:
-                    col = _to_rgb3_from_value(tc_px[x, h3 - 1])
-                    if similar_col_rgb(col, bgc) and visited[h3 - 1][x] == 0:
-                        stack.append((x, h3 - 1))
-                        visited[h3 - 1][x] = 1
-                except Exception:
-                    pass
-            for y in range(h3):
-                try:
-                    col = _to_rgb3_from_value(tc_px[0, y])
-                    if similar_col_rgb(col, bgc) and visited[y][0] == 0:
-                        stack.append((0, y))
-                        visited[y][0] = 1
-                except Exception:
-                    pass
-                try:
-                    col = _to_rgb3_from_value(tc_px[w3 - 1, y])
-                    if similar_col_rgb(col, bgc) and visited[y][w3 - 1] == 0:
-                        stack.append((w3 - 1, y))
-                        visited[y][w3 - 1] = 1
-                except Exception:
-                    pass
+            diff = arr[..., :3].astype(np.int32) - np.array(bgc, dtype=np.int32)
+            similar = (diff * diff).sum(axis=-1) <= tol * tol
 
-            # 4-connected flood-fill
-            while stack:
-                x, y = stack.pop()
-                # examine neighbours
-                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                    nx = x + dx
-                    ny = y + dy
-                    if nx < 0 or ny < 0 or nx >= w3 or ny >= h3:
-                        continue
-                    if visited[ny][nx]:
-                        continue
-                    try:
-                        ncol = _to_rgb3_from_value(tc_px[nx, ny])
-                        if similar_col_rgb(ncol, bgc):
-                            visited[ny][nx] = 1
-                            stack.append((nx, ny))
-                    except Exception:
-                        pass
+            # 4-connected flood-fill as repeated masked dilation, seeded with matching border pixels;
+            # each step grows the whole front at once, so the loop runs ~tile-radius times
+            if similar.all():
+                mask = similar
+            else:
+                mask = np.zeros_like(similar)
+                mask[[0, -1], :] = similar[[0, -1], :]
+                mask[:, [0, -1]] = similar[:, [0, -1]]
+                while True:
+                    grown = mask.copy()
+                    grown[1:] |= mask[:-1]
+                    grown[:-1] |= mask[1:]
+                    grown[:, 1:] |= mask[:, :-1]
+                    grown[:, :-1] |= mask[:, 1:]
+                    grown &= similar
+                    if np.array_equal(grown, mask):
+                        break
+                    mask = grown
 
             # Set background-connected pixels to transparent only
-            for yy in range(h3):
-                for xx in range(w3):
-                    try:
-                        if visited[yy][xx]:
-                            # preserve existing alpha if any by writing full transparent pixel
-                            tc_px[xx, yy] = (0, 0, 0, 0)
-                    except Exception:
-                        pass
-            return tc
+            arr[mask] = 0
+            return Image.fromarray(arr, 'RGBA')
         except Exception:
             return im
 
     # sheet crop dialog implementation removed — all crop editing is now inline in the main dialog
 
-    def update_preview(ev=None):
+    def rebuild_preview():
         """Build a preview that matches the import pipeline: apply sheet crop, per-tile crop (if enabled), transparency filling and downscale.
         The preview thumbnails show the final tiles as they will be written (but limited to a reasonable display size).
         """
@@ -381,7 +306,6 @@ def open_import_dialog(editor, ev):
                 mode = (edge_mode_field.value or '').lower()
             except Exception:
                 mode = 'trim to whole tiles'
-            import math
             if mode.startswith('trim'):
                 cols = max(1, sw // tw)
                 rows = max(1, sh // th)
@@ -415,7 +339,9 @@ def open_import_dialog(editor, ev):
 
             max_preview = min(100, total)
             count = 0
-            # no local tempfile use here
+            preview_tiles = []
+            # same-shaped tiles share one resize plan per update
+            resize_plans = {}
 
             try:
                 downscale_f = float((downscale_field.value or '1').strip())
@@ -425,11 +351,20 @@ def open_import_dialog(editor, ev):
             # use shared tile bbox helper for preview and import
             # (defined below as _tile_bbox)
 
+            # alpha plane of the sheet, so fully transparent tiles can be skipped before any per-tile work
+            try:
+                sheet_alpha = np.asarray(work_img.getchannel('A')) if skip_empty_cb.value else None
+            except Exception:
+                sheet_alpha = None
+
             # build preview using the final tile output as in import
             for r in range(rows):
                 for c in range(cols):
                     if count >= max_preview:
                         break
+                    # below _tile_bbox's alpha threshold the tile stays empty through crop/keying/downscale
+                    if sheet_alpha is not None and sheet_alpha[r*th:(r+1)*th, c*tw:(c+1)*tw].max(initial=0) < 16:
+                        continue
                     box = (c*tw, r*th, c*tw + tw, r*th + th)
                     try:
                         tile = work_img.crop(box).convert('RGBA')
@@ -498,39 +433,31 @@ def open_import_dialog(editor, ev):
                                     scale = max_display / float(max(disp_w, disp_h))
                                     rdw = max(1, int(round(disp_w * scale)))
                                     rdh = max(1, int(round(disp_h * scale)))
-                                    try:
-                                        resamp = Image.Resampling.BICUBIC
-                                    except Exception:
-                                        resamp = Image.BICUBIC if hasattr(Image, 'BICUBIC') else 1
-                                    display_img = final_tile.resize((rdw, rdh), resamp)
+                                    display_img = _lanczos_resize(final_tile, (rdw, rdh), resize_plans)
                                 except Exception:
                                     display_img = final_tile
                             else:
                                 # show actual final pixels, no upscaling
                                 display_img = final_tile
 
-                        if display_img is not None:
-                            try:
-                                buf = _io.BytesIO()
-                                display_img.save(buf, format='PNG')
-                                b64 = base64.b64encode(buf.getvalue()).decode('ascii')
-                                # append directly to wrap container so items wrap automatically
-                                preview_container.controls.append(ft.Container(content=ft.Image(src_base64=b64, width=display_img.width, height=display_img.height)))
-                            except Exception:
-                                pass
-                        else:
-                            # placeholder if tile missing
-                            try:
-                                preview_container.controls.append(ft.Container(content=ft.Text('n/a')))
-                            except Exception:
-                                pass
+                        # missing tiles are left as a blank cell in the atlas
+                        preview_tiles.append(display_img)
                     except Exception:
                         pass
                     count += 1
                 if count >= max_preview:
                     break
 
-            # no row flushing needed with Wrap
+            # all preview tiles go out as a single image instead of one PNG/control per tile
+            if preview_tiles:
+                try:
+                    atlas = _tile_atlas(preview_tiles, PREVIEW_WIDTH)
+                    buf = _io.BytesIO()
+                    atlas.save(buf, format='PNG', optimize=False, compress_level=1)
+                    b64 = base64.b64encode(buf.getvalue()).decode('ascii')
+                    preview_container.controls.append(ft.Image(src_base64=b64, width=atlas.width, height=atlas.height))
+                except Exception:
+                    logger.exception("Failed to build preview atlas")
             try:
                 preview_container.update()
             except Exception:
@@ -549,8 +476,35 @@ def open_import_dialog(editor, ev):
             except Exception:
                 pass
 
+    preview_timer = None
+    preview_lock = threading.Lock()
+
+    def run_preview():
+        # each rebuild clears and refills preview_container, so two must never overlap
+        with preview_lock:
+            rebuild_preview()
+
+    def schedule_preview(ev=None, delay=0.12):
+        # typing in the path/size fields fires per keystroke; rebuild once input settles.
+        # Every trigger comes through here, so a newer one always supersedes a pending rebuild.
+        nonlocal preview_timer
+        if preview_timer:
+            preview_timer.cancel()
+            preview_timer = None
+        run_thread = getattr(page_local, 'run_thread', None)
+        post = (lambda: run_thread(run_preview)) if run_thread else run_preview
+        if delay <= 0:
+            post()
+            return
+        preview_timer = threading.Timer(delay, post)
+        preview_timer.start()
+
+    def update_preview(ev=None):
+        """Rebuild the preview now, replacing any debounced rebuild still pending."""
+        schedule_preview(delay=0)
+
     try:
-        sheet_path_field.on_change = update_preview
+        sheet_path_field.on_change = schedule_preview
     except Exception:
         pass
     def _suggest_downscale_to_16():
@@ -582,7 +536,7 @@ def open_import_dialog(editor, ev):
         except Exception:
             pass
         try:
-            update_preview()
+            schedule_preview()
         except Exception:
             pass
 
@@ -595,7 +549,7 @@ def open_import_dialog(editor, ev):
     except Exception:
         pass
     try:
-        downscale_field.on_change = update_preview
+        downscale_field.on_change = schedule_preview
     except Exception:
         pass
     try:
@@ -807,18 +761,13 @@ def open_import_dialog(editor, ev):
 
     def pick_background(im):
         w, h = im.size
-        px = im.load()
-        coords = [(0,0),(w-1,0),(0,h-1),(w-1,h-1),(w//2,0),(w//2,h-1),(0,h//2),(w-1,h//2)]
-        samples = []
-        for (sx, sy) in coords:
-            try:
-                samples.append(tuple(int(v) for v in px[sx, sy]))
-            except Exception:
-                pass
-        if not samples:
+        if w <= 0 or h <= 0:
             return (255,255,255,255)
-        most = Counter(samples).most_common(1)[0][0]
-        return most
+        arr = np.asarray(im.convert('RGBA'))
+        # corners, edge midpoints
+        xs = np.array([0, w-1, 0, w-1, w//2, w//2, 0, w-1])
+        ys = np.array([0, 0, h-1, h-1, 0, h-1, h//2, h//2])
+        return _most_common_row(arr[ys, xs])
 
     def detect_sheet_border_crop(path, tol=18):
         """Detect a single-colour border around the sprite sheet and return a crop box in original coordinates or None.
@@ -829,31 +778,14 @@ def open_import_dialog(editor, ev):
                 return None
             im = Image.open(path).convert('RGBA')
             bg = pick_background(im)
-            px = im.load()
             w, h = im.size
-            min_x = w
-            min_y = h
-            max_x = 0
-            max_y = 0
-            found = False
-            for y in range(h):
-                for x in range(w):
-                    try:
-                        p = px[x, y]
-                        if not similar_color(p, bg, tol=tol):
-                            found = True
-                            if x < min_x:
-                                min_x = x
-                            if y < min_y:
-                                min_y = y
-                            if x > max_x:
-                                max_x = x
-                            if y > max_y:
-                                max_y = y
-                    except Exception:
-                        pass
-            if not found:
+            fg = foreground_mask(im, bg, tol=tol)
+            cols = np.flatnonzero(fg.any(axis=0))
+            rows = np.flatnonzero(fg.any(axis=1))
+            if not cols.size:
                 return None
+            min_x, max_x = int(cols[0]), int(cols[-1])
+            min_y, max_y = int(rows[0]), int(rows[-1])
             # bounding box is inclusive [min_x, max_x], convert to crop box (left, top, right+1, bottom+1)
             return (max(0, min_x), max(0, min_y), min(w, max_x+1), min(h, max_y+1))
         except Exception:
@@ -864,65 +796,48 @@ def open_import_dialog(editor, ev):
         br,bg,bb,ba = b
         return ((ar-br)**2 + (ag-bg)**2 + (ab-bb)**2) <= (tol*tol)
 
+    def foreground_mask(im, bg, tol=18):
+        """Boolean (h, w) mask of pixels whose RGB differs from `bg` by more than `tol` (see similar_color)."""
+        arr = np.asarray(im.convert('RGBA'), dtype=np.int32)
+        d = arr[..., :3] - np.asarray(bg[:3], dtype=np.int32)
+        return (d * d).sum(axis=2) > tol * tol
+
     def detect_grid(im, bg):
         w,h = im.size
-        px = im.load()
-        row_proj = [0]*h
-        col_proj = [0]*w
-        for y in range(h):
-            s=0
-            for x in range(w):
-                try:
-                    if not similar_color(px[x,y], bg):
-                        s += 1
-                except Exception:
-                    pass
-            row_proj[y]=s
-        for x in range(w):
-            s=0
-            for y in range(h):
-                try:
-                    if not similar_color(px[x,y], bg):
-                        s += 1
-                except Exception:
-                    pass
-            col_proj[x]=s
+        fg = foreground_mask(im, bg)
+        row_proj = fg.sum(axis=1)
+        col_proj = fg.sum(axis=0)
 
         row_thresh = max(1, int(w*0.02))
         col_thresh = max(1, int(h*0.02))
         def starts_from_proj(proj, thresh):
-            starts=[]
-            in_region=False
-            for i,v in enumerate(proj):
-                if v>thresh and not in_region:
-                    starts.append(i)
-                    in_region=True
-                elif v<=thresh and in_region:
-                    in_region=False
-            return starts
-
-        row_starts = starts_from_proj(row_proj, row_thresh)
-        col_starts = starts_from_proj(col_proj, col_thresh)
-        row_spacings = [j-i for i,j in zip(row_starts, row_starts[1:])] if len(row_starts)>1 else []
-        col_spacings = [j-i for i,j in zip(col_starts, col_starts[1:])] if len(col_starts)>1 else []
+            # indices where the projection rises above thresh (a leading run starts at 0)
+            m = (np.asarray(proj) > thresh).astype(np.int8)
+            return np.flatnonzero(np.diff(m, prepend=0) == 1)
+
+        row_starts_a = starts_from_proj(row_proj, row_thresh)
+        col_starts_a = starts_from_proj(col_proj, col_thresh)
+        row_starts = row_starts_a.tolist()
+        col_starts = col_starts_a.tolist()
+        row_spacings = np.diff(row_starts_a)
+        col_spacings = np.diff(col_starts_a)
 
         def median_or_zero(arr):
-            if not arr:
+            if arr.size == 0:
                 return 0
-            a=sorted(arr)
-            return a[len(a)//2]
+            k = arr.size // 2
+            return int(np.partition(arr, k)[k])
         candidates = []
         try:
-            import math
-            if col_spacings:
-                g = math.gcd(*col_spacings)
+            if col_spacings.size:
+                g = int(np.gcd.reduce(col_spacings))
                 if g>1:
                     candidates.append(g)
                 m = median_or_zero(col_spacings)
                 if m>1:
                     candidates.append(m)
-            if row_spacings:
-                g = math.gcd(*row_spacings)
+            if row_spacings.size:
+                g = int(np.gcd.reduce(row_spacings))
                 if g>1 and g not in candidates:
                     candidates.append(g)
                 m = median_or_zero(row_spacings)
@@ -953,21 +868,14 @@ def open_import_dialog(editor, ev):
         best_score = -1
         best_result = None
         best_img = None
-        try:
-            resample_filter = Image.Resampling.LANCZOS
-        except Exception:
-            try:
-                resample_filter = Image.LANCZOS
-            except Exception:
-                resample_filter = Image.BICUBIC
+        # box-filter pyramid: 1/4 is reduced from 1/2 rather than from the full sheet
+        levels = {1: img}
         for scale in [1,2,3,4]:
             try:
-                if scale == 1:
-                    im_test = img
-                else:
-                    new_w = max(1, img.width // scale)
-                    new_h = max(1, img.height // scale)
-                    im_test = img.resize((new_w, new_h), resample=resample_filter)
+                if scale not in levels:
+                    src, factor = (levels[2], 2) if scale == 4 and 2 in levels else (img, scale)
+                    levels[scale] = src.reduce(factor)
+                im_test = levels[scale]
                 bg = pick_background(im_test)
                 result = detect_grid(im_test, bg)
                 score = result['cols'] * result['rows']
@@ -1341,11 +1249,12 @@ def open_import_dialog(editor, ev):
         except Exception:
             pass
 
-    def perform_import(path, tw, th, pref):
+    def perform_import(path, tw, th, pref, img=None):
         """Import tiles and write them to .stamps/imported; do not touch stamp dialog UI controls here.
+        `img` may be the sheet already opened from `path` by the caller, to avoid opening it twice.
         """
         try:
-            img = Image.open(path).convert('RGBA')
+            img = (img if img is not None else Image.open(path)).convert('RGBA')
             # apply sheet-level crop override to the whole sheet before slicing into tiles
             try:
                 if sheet_crop_override:
@@ -1357,7 +1266,6 @@ def open_import_dialog(editor, ev):
                 mode = (edge_mode_field.value or '').lower()
             except Exception:
                 mode = 'trim to whole tiles'
-            import math
             if mode.startswith('trim'):
                 cols = sw // tw
                 rows = sh // th
@@ -1385,42 +1293,24 @@ def open_import_dialog(editor, ev):
                 os.makedirs(ensure_dir, exist_ok=True)
             except Exception:
                 pass
+            # slice the whole sheet into a (rows, cols, th, tw, 4) block in one go; cells past the
+            # sheet edge stay transparent, as Image.crop would leave them
+            sheet = np.asarray(work_img.convert('RGBA'))
+            grid = np.zeros((rows * th, cols * tw, 4), dtype=np.uint8)
+            gh, gw = min(rows * th, sheet.shape[0]), min(cols * tw, sheet.shape[1])
+            grid[:gh, :gw] = sheet[:gh, :gw]
+            tiles = grid.reshape(rows, th, cols, tw, 4).swapaxes(1, 2)
+            # tiles with no pixel at alpha >= 128 stay empty through crop/keying/downscale
+            tile_empty = tiles[..., 3].max(axis=(2, 3)) < 128
             written = 0
             cropped_tiles = 0
+            pending = []
             for r in range(rows):
                 for c in range(cols):
                     try:
-                        box = (c*tw, r*th, c*tw + tw, r*th + th)
-                        try:
-                            tile = work_img.crop(box).convert('RGBA')
-                        except Exception:
-                            tile = None
-
-                        def tile_to_pixels(im):
-                            pxs = []
-                            for yy in range(im.height):
-                                row = []
-                                for xx in range(im.width):
-                                    try:
-                                        pr, pg, pb, pa = im.getpixel((xx, yy))
-                                    except Exception:
-                                        val = im.getpixel((xx, yy))
-                                        if isinstance(val, (int, float)):
-                                            pr = pg = pb = int(val)
-                                            pa = 255
-                                        else:
-                                            try:
-                                                pr, pg, pb = val[:3]
-                                                pa = val[3] if len(val) > 3 else 255
-                                            except Exception:
-                                                pr = pg = pb = 0
-                                                pa = 255
-                                    if pa < 128:
-                                        row.append(None)
-                                    else:
-                                        row.append(f"#{pr:02X}{pg:02X}{pb:02X}")
-                                pxs.append(row)
-                            return pxs
+                        if skip_empty_cb.value and tile_empty[r, c]:
+                            continue
+                        tile = Image.fromarray(np.ascontiguousarray(tiles[r, c]), 'RGBA')
 
                         final_tile = tile
                         try:
@@ -1458,30 +1348,24 @@ def open_import_dialog(editor, ev):
                             downscale_f = float(downscale_field.value or '1')
                         except Exception:
                             downscale_f = 1.0
+                        packed = _tile_to_np(final_tile)
                         if abs(downscale_f - 1.0) > 1e-6:
-                            try:
-                                resample = Image.Resampling.NEAREST
-                            except Exception:
-                                resample = Image.NEAREST if hasattr(Image, 'NEAREST') else 0
+                            # NEAREST downscale is pure indexing, so do it on the packed tile
                             nw = max(1, int(round(final_tile.width * downscale_f)))
                             nh = max(1, int(round(final_tile.height * downscale_f)))
-                            try:
-                                final_tile = final_tile.resize((nw, nh), resample)
-                            except Exception:
-                                pass
-                        pixels = tile_to_pixels(final_tile)
-                        if skip_empty_cb.value and all(all(p is None for p in row) for row in pixels):
+                            packed = resize_nearest(packed, (nw, nh))
+                        if skip_empty_cb.value and not packed.any():
                             continue
+                        pixels = np_to_pixels(packed)
                         name = f"{pref}_{r}_{c}"
                         outp = os.path.join(ensure_dir, name + '.json')
-                        try:
-                            with open(outp, 'w', encoding='utf-8') as fh:
-                                json.dump({"metadata": {"name": name, "source": os.path.basename(path)}, "pixels": pixels}, fh, indent=2)
-                            written += 1
-                        except Exception as ex:
-                            logger.exception(f"Failed writing stamp file {outp}: {ex}")
+                        pending.append((outp, {"metadata": {"name": name, "source": os.path.basename(path)}, "pixels": pixels}))
                     except Exception:
                         logger.exception("Error processing tile during import")
+            # encode and write the stamp files concurrently; the work is mostly file syscalls
+            if pending:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+                    written = sum(ex.map(lambda job: _write_stamp_json(*job), pending))
             status_import.value = f"Wrote {written} stamps to {ensure_dir} (cropped {cropped_tiles})"
             try:
                 status_import.update()
@@ -1529,7 +1413,7 @@ def open_import_dialog(editor, ev):
                         page_local.close(confirm_dlg)
                     except Exception:
                         pass
-                    perform_import(path, tw, th, pref)
+                    perform_import(path, tw, th, pref, img=img)
                 def do_cancel(ev3):
                     try:
                         page_local.close(confirm_dlg)
@@ -1538,7 +1422,7 @@ def open_import_dialog(editor, ev):
                 confirm_dlg = ft.AlertDialog(title=ft.Text("Large import"), content=ft.Text(f"This will create {total} stamps ({cols}x{rows}). Continue?"), actions=[ft.TextButton("Yes, import", on_click=do_confirm), ft.TextButton("Cancel", on_click=do_cancel)])
                 page_local.open(confirm_dlg)
                 return
-            perform_import(path, tw, th, pref)
+            perform_import(path, tw, th, pref, img=img)
         except Exception as ex:
             logger.exception(f"Error preparing import: {ex}")
             status_import.value = f"Import failed: {ex}"
@@ -1680,7 +1564,7 @@ def open_import_dialog(editor, ev):
         ft.Row([downscale_field, skip_empty_cb, crop_tiles_cb, transparent_bg_cb], spacing=8),
         ft.Container(content=ft.Row([ft.Text('Status:'), warn_preview], spacing=8), padding=0),
         status_import,
-        ft.Container(content=ft.Column([preview_container], scroll=ft.ScrollMode.AUTO, height=360), width=680),
+        ft.Container(content=ft.Column([preview_container], scroll=ft.ScrollMode.AUTO, height=360), width=PREVIEW_WIDTH),
     ], spacing=8, width=700, height=600)
     import_dlg = ft.AlertDialog(title=ft.Text("Import Sprite Sheet"), content=content, actions=[ft.TextButton("Import", on_click=do_import), ft.TextButton("Cancel", on_click=lambda ev: page_local.close(import_dlg))], open=False)
     global IMPORT_DIALOG
@@ -3,11 +3,13 @@ import flet as ft
 import sys
 import os
 from loguru import logger
-from PIL import Image
+from PIL import Image, ImageEnhance
+import numpy as np
 import json
 import re
 import hashlib
-import copy
+import threading
+import functools
 from yoto_up.paths import OFFICIAL_ICON_CACHE_DIR, FLET_APP_STORAGE_DATA, USER_ICONS_DIR
 
 try:
@@ -22,6 +24,17 @@ try:
     from yoto_up.yoto_app.pixel_fonts import _font_3x5, _font_5x7
     from yoto_up.yoto_app.colour_picker import ColourPicker
     from yoto_up.yoto_app.stamp_dialog import open_image_stamp_dialog
+    from yoto_up.yoto_app.pixel_grid import (
+        blit_stamp,
+        image_to_np,
+        np_to_image,
+        np_to_pixels,
+        pack_rgba,
+        pixels_to_np,
+        png_base64,
+        resize_nearest,
+        unpack_rgba,
+    )
 except ImportError:
     # fallback for legacy local imports
     from icon_import_helpers import (
@@ -33,7 +46,17 @@ except ImportError:
     from pixel_fonts import _font_3x5, _font_5x7
     from colour_picker import ColourPicker
     from stamp_dialog import open_image_stamp_dialog
-import colorsys
+    from pixel_grid import (
+        blit_stamp,
+        image_to_np,
+        np_to_image,
+        np_to_pixels,
+        pack_rgba,
+        pixels_to_np,
+        png_base64,
+        resize_nearest,
+        unpack_rgba,
+    )
 import base64
 import io
 
@@ -41,8 +64,32 @@ import io
 if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ICON_DIR = USER_ICONS_DIR
 
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path, obj):
+    """Write `obj` as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as fh:
+            fh.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(obj, fh, ensure_ascii=False, indent=2)
+
 # Prefer FLET_APP_STORAGE_TEMP if set via environment; otherwise use data dir under the configured cache dir
 _flet_tmp = os.getenv("FLET_APP_STORAGE_TEMP")
 if _flet_tmp:
@@ -51,31 +98,235 @@ else:
     CHECK_IMAGE = OFFICIAL_ICON_CACHE_DIR / Path("__checker.png")
 
 
+@functools.lru_cache(maxsize=1)
+def _checker_base64():
+    """Base64 of the checker tile drawn in transparent cells, created on first use and read once per process."""
+    if not CHECK_IMAGE.exists():
+        from PIL import ImageDraw
+
+        sq = 8
+        im = Image.new("RGBA", (sq * 2, sq * 2), (255, 255, 255, 0))
+        draw = ImageDraw.Draw(im)
+        draw.rectangle([0, 0, sq - 1, sq - 1], fill=(200, 200, 200, 255))
+        draw.rectangle([sq, sq, sq * 2 - 1, sq * 2 - 1], fill=(200, 200, 200, 255))
+        im.save(str(CHECK_IMAGE))
+    return get_base64_from_path(CHECK_IMAGE)
+
+# classic sepia weights laid out for `rgb @ _SEPIA_MATRIX` (column j feeds output channel j)
+_SEPIA_MATRIX = np.array(
+    [
+        [0.393, 0.349, 0.272],
+        [0.769, 0.686, 0.534],
+        [0.189, 0.168, 0.131],
+    ],
+    dtype=np.float32,
+)
+
+
+# Filters on (h, w, 4) uint8 RGBA arrays; most work in place and return their input.
+# The editor's on_* handlers run them straight on _pixels_to_rgba output; the
+# PIL-facing methods wrap them.
+def _invert_rgba(arr):
+    arr[..., :3] = 255 - arr[..., :3]
+    return arr
+
+
+def _hue_rgba(arr, degrees):
+    # colorsys HLS maths, evaluated once per distinct RGB value and scattered back
+    packed = arr[..., :3].astype(np.uint32)
+    packed = (packed[..., 0] << 16) | (packed[..., 1] << 8) | packed[..., 2]
+    uniq, inv = np.unique(packed.ravel(), return_inverse=True)
+    rgb = np.stack([(uniq >> 16) & 0xFF, (uniq >> 8) & 0xFF, uniq & 0xFF], axis=-1) / 255.0
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    lightness = sumc / 2.0
+    grey = rangec == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(lightness <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+        h = ((h / 6.0) % 1.0 + degrees / 360) % 1
+        m2 = np.where(lightness <= 0.5, lightness * (1.0 + s), lightness + s - (lightness * s))
+        m1 = 2.0 * lightness - m2
+
+        def channel(hue):
+            hue = hue % 1.0
+            return np.select(
+                [hue < 1 / 6, hue < 0.5, hue < 2 / 3],
+                [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6.0],
+                m1,
+            )
+
+        out_rgb = np.stack([channel(h + 1 / 3), channel(h), channel(h - 1 / 3)], axis=-1)
+        out_rgb[grey] = lightness[grey, None]
+    arr[..., :3] = (out_rgb * 255).astype(np.uint8)[inv.reshape(arr.shape[:2])]
+    return arr
+
+
+def _replace_rgba(arr, target_color, replacement_color):
+    mask = (arr[..., :3] == np.asarray(target_color[:3], dtype=arr.dtype)).all(axis=-1)
+    arr[mask] = replacement_color
+    return arr
+
+
+def _overlay_rgba(arr, gradient):
+    # Image.alpha_composite's fixed-point SRC_OVER for a solid colour; the blend
+    # coefficients depend only on the destination alpha, so they come from a table
+    r, g, b, a = (int(v) for v in gradient)
+    if a == 0:
+        return arr
+
+    def div255(v):
+        return ((v >> 8) + v) >> 8
+
+    # every intermediate stays below 2**25, so int32 is wide enough
+    dst_a = np.arange(256, dtype=np.int32)
+    outa255 = a * 255 + dst_a * (255 - a)
+    coef1 = (a * 255 * 255 * 128) // outa255
+    coef2 = 255 * 128 - coef1
+    alpha = arr[..., 3]
+    c1 = coef1[alpha]
+    c2 = coef2[alpha]
+    for i, c in enumerate((r, g, b)):
+        blended = c * c1 + arr[..., i].astype(np.int32) * c2 + (0x80 << 7)
+        arr[..., i] = div255(blended) >> 7
+    arr[..., 3] = div255(outa255 + 0x80)[alpha]
+    return arr
+
+
+def _opacity_rgba(arr, opacity):
+    lut = np.clip(np.arange(256) * opacity, 0, 255).astype(np.uint8)
+    arr[..., 3] = lut[arr[..., 3]]
+    return arr
+
+
+def _pixelate_rgba(arr, pixel_size):
+    # NEAREST down to 1/pixel_size and back up, matching the two Image.resize calls
+    h, w = arr.shape[:2]
+    if w // pixel_size < 1 or h // pixel_size < 1:
+        raise ValueError("pixel_size is larger than the image")
+    small = resize_nearest(arr, (w // pixel_size, h // pixel_size))
+    return resize_nearest(small, (w, h))
+
+
+def _sepia_rgba(arr, scratch=None):
+    # `scratch` is an optional pair of float32 (h, w, 3) buffers reused across calls
+    shape = arr.shape[:2] + (3,)
+    if scratch is None or scratch[0].shape != shape:
+        scratch = (np.empty(shape, np.float32), np.empty(shape, np.float32))
+    rgb, toned = scratch
+    np.copyto(rgb, arr[..., :3])
+    np.matmul(rgb, _SEPIA_MATRIX, out=toned)
+    # truncate like int() did, after clamping the >255 highlights
+    np.clip(toned, 0, 255, out=toned)
+    np.copyto(arr[..., :3], toned, casting="unsafe")
+    return arr
+
+# patterns used by _parse_color for rgba(...) and comma/space separated inputs
+_NUMBER_RE = re.compile(r"[0-9]*\.?[0-9]+")
+_HEX_SPLIT_RE = re.compile(r"[,\s]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_color(s, alpha=255):
+    """Parse a stripped colour string for PixelArtEditor._hex_to_rgba (memoised; palettes are small)."""
+    # rgba(...) format
+    if s.lower().startswith("rgba"):
+        try:
+            nums = _NUMBER_RE.findall(s)
+            if len(nums) >= 3:
+                r = int(float(nums[0]))
+                g = int(float(nums[1]))
+                b = int(float(nums[2]))
+                a = (
+                    int(float(nums[3]) * 255)
+                    if len(nums) > 3 and float(nums[3]) <= 1
+                    else (int(float(nums[3])) if len(nums) > 3 else alpha)
+                )
+                return (r, g, b, a)
+        except Exception:
+            return (0, 0, 0, alpha)
+
+    # strip leading '#'
+    if s.startswith("#"):
+        s = s[1:]
+
+    try:
+        if len(s) == 3:
+            r = int(s[0] * 2, 16)
+            g = int(s[1] * 2, 16)
+            b = int(s[2] * 2, 16)
+            return (r, g, b, alpha)
+        if len(s) == 4:  # rgba in hex short form
+            r = int(s[0] * 2, 16)
+            g = int(s[1] * 2, 16)
+            b = int(s[2] * 2, 16)
+            a = int(s[3] * 2, 16)
+            return (r, g, b, a)
+        if len(s) == 6:
+            r = int(s[0:2], 16)
+            g = int(s[2:4], 16)
+            b = int(s[4:6], 16)
+            return (r, g, b, alpha)
+        if len(s) == 8:
+            r = int(s[0:2], 16)
+            g = int(s[2:4], 16)
+            b = int(s[4:6], 16)
+            a = int(s[6:8], 16)
+            return (r, g, b, a)
+        # try comma/space separated numbers
+        parts = [p for p in _HEX_SPLIT_RE.split(s) if p]
+        if len(parts) >= 3:
+            r = int(float(parts[0]))
+            g = int(float(parts[1]))
+            b = int(float(parts[2]))
+            a = int(float(parts[3])) if len(parts) > 3 else alpha
+            return (r, g, b, a)
+    except Exception:
+        return (0, 0, 0, alpha)
+
+    return (0, 0, 0, alpha)
+
+
+_DEFAULT_PALETTE = (
+    "#000000",
+    "#FFFFFF",
+    "#FF0000",
+    "#00FF00",
+    "#0000FF",
+    "#FFFF00",
+    "#FF00FF",
+    "#00FFFF",
+    "#888888",
+    "#FFA500",
+    "#800080",
+    "#008000",
+    "#808000",
+    "#008080",
+    "#C0C0C0",
+    "#A52A2A",
+)
+
+# opaque RGBA of the preset swatches keyed by lower-cased hex; _hex_to_rgba checks
+# this plain dict before falling back to the memoised parser
+_PRESET_RGBA = {h.lower(): _parse_color(h.lower()) for h in _DEFAULT_PALETTE}
+
+
 class PixelArtEditor:
     def __init__(self, size=16, pixel_size=24, page=None, loading_dialog=None):
         self.size = size
         self.pixel_size = pixel_size
         self.current_color = "#000000"
-        self.colors = [
-            "#000000",
-            "#FFFFFF",
-            "#FF0000",
-            "#00FF00",
-            "#0000FF",
-            "#FFFF00",
-            "#FF00FF",
-            "#00FFFF",
-            "#888888",
-            "#FFA500",
-            "#800080",
-            "#008000",
-            "#808000",
-            "#008080",
-            "#C0C0C0",
-            "#A52A2A",
-        ]
+        self.colors = list(_DEFAULT_PALETTE)
         self.pixels = [["#FFFFFF" for _ in range(size)] for _ in range(size)]
         self.grid = None
+        # cell controls by [y][x], filled in by ensure_grid
+        self._cells = []
         self.color_dropdown = None
         self.clear_btn = None
         self.sampler_mode = False
@@ -93,20 +344,19 @@ class PixelArtEditor:
         self._mouse_down = False
         self._original_pixels = None
         self._palette_backup = None
+        # icon directory, created on the first _ensure_saved_dir call
+        self._saved_dir = None
+        # grid cells painted since the last batched update (see _queue_cell_update)
+        self._dirty_cells = {}
+        self._flush_timer = None
+        # serialises filters run by _run_filter
+        self._filter_lock = threading.Lock()
+        # float32 work buffers for the sepia filter, allocated on first use
+        self._sepia_scratch = None
         # Defer heavy UI construction until the editor is actually shown or used
         self._built = False
 
-        # ensure checker preview exists
-        if not CHECK_IMAGE.exists():
-            from PIL import ImageDraw
-
-            sq = 8
-            im = Image.new("RGBA", (sq * 2, sq * 2), (255, 255, 255, 0))
-            draw = ImageDraw.Draw(im)
-            draw.rectangle([0, 0, sq - 1, sq - 1], fill=(200, 200, 200, 255))
-            draw.rectangle([sq, sq, sq * 2 - 1, sq * 2 - 1], fill=(200, 200, 200, 255))
-            im.save(str(CHECK_IMAGE))
-        self.CHECK_IMAGE_BASE64 = get_base64_from_path(CHECK_IMAGE)
+        self.CHECK_IMAGE_BASE64 = _checker_base64()
 
     def _build(self):
         # mark built early to avoid recursion if _build triggers ensure_built
@@ -249,6 +499,7 @@ class PixelArtEditor:
                 try:
                     self._mouse_down = False
                     self._drag_painting = False
+                    self._end_stroke()
                 except Exception:
                     pass
 
@@ -304,6 +555,7 @@ class PixelArtEditor:
                         self._mouse_down = False
                         # end drag painting session
                         self._drag_painting = False
+                        self._end_stroke()
                     except Exception:
                         pass
 
@@ -830,13 +1082,7 @@ class PixelArtEditor:
             if target == "":
                 target = None
             self._push_undo()
-            for yy in range(self.size):
-                for xx in range(self.size):
-                    try:
-                        if self._color_distance(self.pixels[yy][xx], target) <= t:
-                            self.pixels[yy][xx] = r
-                    except Exception:
-                        pass
+            self._replace_similar(target, r, t)
             try:
                 self.refresh_grid()
             except Exception:
@@ -1120,6 +1366,7 @@ class PixelArtEditor:
         # internal undo/redo stacks
         self._undo_stack = []
         self._redo_stack = []
+        self._stroke_delta = None
 
         # Wire dialog handlers for the buttons
         try:
@@ -1219,8 +1466,7 @@ class PixelArtEditor:
             p = str(path)
             if p.lower().endswith(".json"):
                 try:
-                    with open(p, "r", encoding="utf-8") as fh:
-                        obj = json.load(fh)
+                    obj = _read_json(p)
                 except Exception:
                     obj = None
                 if isinstance(obj, dict):
@@ -1310,19 +1556,17 @@ class PixelArtEditor:
         return False
 
     def on_color_set_change(self, e):
-        import copy
-
         set_name = self.color_set_dropdown.value
         palette = self.color_sets.get(set_name, self.palette_colors)
         # If switching to Default, restore backup
         if set_name == "Default" and self._palette_backup is not None:
             self._push_undo()
-            self.pixels = copy.deepcopy(self._palette_backup)
+            self.pixels = [row[:] for row in self._palette_backup]
             self.refresh_grid()
             return
         # If switching away from Default, store backup
         if set_name != "Default" and self._palette_backup is None:
-            self._palette_backup = copy.deepcopy(self.pixels)
+            self._palette_backup = [row[:] for row in self.pixels]
 
         def closest(hex_color):
             # If hex_color is None (transparent), preserve it
@@ -1353,19 +1597,17 @@ class PixelArtEditor:
         s = self.saturation_slider.value
         # Store original grid before first adjustment
         if self._original_pixels is None:
-            self._original_pixels = copy.deepcopy(self.pixels)
+            self._original_pixels = [row[:] for row in self.pixels]
         # If all sliders are at 1.0, restore original
         if b == 1.0 and c == 1.0 and s == 1.0:
             if self._original_pixels is not None:
                 # restoring original does not need to push undo
-                self.pixels = copy.deepcopy(self._original_pixels)
+                self.pixels = [row[:] for row in self._original_pixels]
                 self.refresh_grid()
             return
         # Otherwise, apply adjustments to original
         self._push_undo()
         img = self._pixels_to_image(self._original_pixels)
-        from PIL import ImageEnhance
-
         img = ImageEnhance.Brightness(img).enhance(b)
         img = ImageEnhance.Contrast(img).enhance(c)
         img = ImageEnhance.Color(img).enhance(s)
@@ -1559,8 +1801,7 @@ class PixelArtEditor:
                 # If the cache file is JSON, try to extract metadata + pixels (or embedded png)
                 if path.lower().endswith(".json"):
                     try:
-                        with open(path, "r", encoding="utf-8") as fh:
-                            obj = json.load(fh)
+                        obj = _read_json(path)
                     except Exception:
                         obj = None
                     if isinstance(obj, dict):
@@ -1794,7 +2035,7 @@ class PixelArtEditor:
                 pass
 
             # painting behaviour
-            self._push_undo()
+            self._push_undo_entry({(x, y): self.pixels[y][x]})
             self.pixels[y][x] = self.current_color
             # render transparent as no bgcolor (None)
             if self.current_color is None:
@@ -1936,6 +2177,19 @@ class PixelArtEditor:
         except Exception:
             return 255
 
+    def _replace_similar(self, target_color, replacement_color, tolerance):
+        """Set every cell within `tolerance` of `target_color` (per _color_distance) to `replacement_color`."""
+        # grids hold a handful of distinct colours, so measure each one once
+        hits = {}
+        for row in self.pixels[: self.size]:
+            for x in range(min(len(row), self.size)):
+                v = row[x]
+                hit = hits.get(v)
+                if hit is None:
+                    hit = hits[v] = self._color_distance(v, target_color) <= tolerance
+                if hit:
+                    row[x] = replacement_color
+
     def _flood_fill(self, sx, sy, target_color, replacement_color, tolerance=32):
         """Flood-fill contiguous area starting at (sx,sy). Colors within tolerance are considered matching."""
         if tolerance < 0:
@@ -2093,13 +2347,7 @@ class PixelArtEditor:
             if target == "":
                 target = None
             self._push_undo()
-            for y in range(self.size):
-                for x in range(self.size):
-                    try:
-                        if self._color_distance(self.pixels[y][x], target) <= t:
-                            self.pixels[y][x] = r
-                    except Exception:
-                        pass
+            self._replace_similar(target, r, t)
             try:
                 self.refresh_grid()
             except Exception:
@@ -2208,12 +2456,17 @@ class PixelArtEditor:
 
     def refresh_grid(self):
         logger.debug("PixelArtEditor.refresh_grid: Refreshing grid")
-        for y, row in enumerate(self.grid.controls):
-            for x, cell in enumerate(row.controls):
+        # Cells are also painted directly (clicks, drags), so compare against what each
+        # cell currently shows and only send the ones that differ.
+        changed = []
+        for y, row in enumerate(self._cells):
+            for x, cell in enumerate(row):
                 val = self.pixels[y][x]
                 try:
                     if val is None:
                         # transparent: show checker image
+                        if cell.bgcolor is None and cell.content is not None:
+                            continue
                         try:
                             cell.content = ft.Image(
                                 src_base64=self.CHECK_IMAGE_BASE64,
@@ -2229,57 +2482,66 @@ class PixelArtEditor:
                             cell.bgcolor = "#FFFFFF"
                     else:
                         # opaque or semi-transparent: remove checker and set bgcolor to composite over white if needed
-                        try:
-                            cell.content = None
-                        except Exception:
-                            pass
                         try:
                             r, g, b, a = self._hex_to_rgba(val, alpha=255)
                             if a < 255:
                                 r2 = int((r * a + 255 * (255 - a)) / 255)
                                 g2 = int((g * a + 255 * (255 - a)) / 255)
                                 b2 = int((b * a + 255 * (255 - a)) / 255)
-                                cell.bgcolor = f"#{r2:02X}{g2:02X}{b2:02X}"
+                                bg = f"#{r2:02X}{g2:02X}{b2:02X}"
                             else:
-                                cell.bgcolor = f"#{r:02X}{g:02X}{b:02X}"
+                                bg = f"#{r:02X}{g:02X}{b:02X}"
                         except Exception:
-                            cell.bgcolor = val
-                    cell.update()
+                            bg = val
+                        if cell.content is None and cell.bgcolor == bg:
+                            continue
+                        try:
+                            cell.content = None
+                        except Exception:
+                            pass
+                        cell.bgcolor = bg
+                    changed.append(cell)
                 except Exception:
                     try:
                         cell.bgcolor = (
                             None if self.pixels[y][x] is None else self.pixels[y][x]
                         )
+                        changed.append(cell)
+                    except Exception:
+                        pass
+        if changed:
+            try:
+                self.page.update(*changed)
+            except Exception:
+                for cell in changed:
+                    try:
                         cell.update()
                     except Exception:
                         pass
-        logger.debug("PixelArtEditor.refresh_grid: Grid refreshed")
+        logger.debug(
+            f"PixelArtEditor.refresh_grid: Grid refreshed ({len(changed)} cells changed)"
+        )
 
     # Helpers for saving/loading
     def _ensure_saved_dir(self):
-        d = ICON_DIR
-        d.mkdir(parents=True, exist_ok=True)
+        d = getattr(self, "_saved_dir", None)
+        if d is None:
+            d = ICON_DIR
+            d.mkdir(parents=True, exist_ok=True)
+            self._saved_dir = d
         return d
 
+    def _pixels_to_rgba(self, pixels):
+        # (h, w, 4) uint8 RGBA planes of the grid, sized to the pixel array; None,
+        # non-string and unparsable cells (and short rows) become fully transparent.
+        return unpack_rgba(pixels_to_np(pixels, self._hex_to_rgba))
+
+    def _rgba_to_pixels(self, arr):
+        # inverse of _pixels_to_rgba; partial alpha is kept as 8-digit hex #RRGGBBAA
+        return np_to_pixels(pack_rgba(arr))
+
     def _pixels_to_image(self, pixels):
-        # Dynamically size output image to pixel array
-        h = len(pixels)
-        w = max(len(row) for row in pixels) if h > 0 else 0
-        img = Image.new("RGBA", (w, h), (255, 255, 255, 0))
-        for y in range(h):
-            for x in range(len(pixels[y])):
-                hexc = pixels[y][x]
-                if hexc is None:
-                    img.putpixel((x, y), (0, 0, 0, 0))
-                elif isinstance(hexc, str):
-                    try:
-                        r, g, b, a = self._hex_to_rgba(hexc, alpha=255)
-                        img.putpixel((x, y), (r, g, b, a))
-                    except Exception:
-                        img.putpixel((x, y), (0, 0, 0, 0))
-                else:
-                    img.putpixel((x, y), (0, 0, 0, 0))
-        return img
+        return Image.fromarray(self._pixels_to_rgba(pixels), "RGBA")
 
     def _pixels_to_base64(self, pixels):
         img = self._pixels_to_image(pixels)
@@ -2306,18 +2568,8 @@ class PixelArtEditor:
                 else:
                     resample = 3  # 3 is BICUBIC in older PIL
             img = img.resize((self.size, self.size), resample)
-        pixels = [["#FFFFFF" for _ in range(self.size)] for _ in range(self.size)]
-        for y in range(self.size):
-            for x in range(self.size):
-                r, g, b, a = img.getpixel((x, y))
-                if a == 0:
-                    pixels[y][x] = None
-                elif a == 255:
-                    pixels[y][x] = f"#{r:02X}{g:02X}{b:02X}"
-                else:
-                    # preserve partial alpha as 8-digit hex #RRGGBBAA
-                    pixels[y][x] = f"#{r:02X}{g:02X}{b:02X}{a:02X}"
-        return pixels
+        # partial alpha is preserved as 8-digit hex #RRGGBBAA
+        return np_to_pixels(image_to_np(img))
 
     def _image_to_base64(self, image):
         buffered = io.BytesIO()
@@ -2328,19 +2580,7 @@ class PixelArtEditor:
         """Convert a PIL Image to a native-size pixel grid (no resizing).
         Returns a list-of-rows where each entry is None or a hex color string.
         """
-        img = img.convert("RGBA")
-        w, h = img.size
-        pixels = [[None for _ in range(w)] for _ in range(h)]
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = img.getpixel((x, y))
-                if a == 0:
-                    pixels[y][x] = None
-                elif a == 255:
-                    pixels[y][x] = f"#{r:02X}{g:02X}{b:02X}"
-                else:
-                    pixels[y][x] = f"#{r:02X}{g:02X}{b:02X}{a:02X}"
-        return pixels
+        return np_to_pixels(image_to_np(img))
 
     def _render_text_to_pixels(
         self,
@@ -2354,7 +2594,8 @@ class PixelArtEditor:
     ):
         """Return a pixel grid (list of rows) with text stamped at given offset. Does not modify self.pixels."""
         # prepare a blank grid
-        grid = [[None for _ in range(self.size)] for _ in range(self.size)]
+        size = self.size
+        grid = [[None] * size for _ in range(size)]
         tx = x_offset
         ty = y_offset
         text = (text or "").upper()
@@ -2367,14 +2608,20 @@ class PixelArtEditor:
         for ch in text:
             glyph = font.get(ch, font.get(" "))
             for row_idx, bits in enumerate(glyph):
+                # clip the scaled glyph row to the grid once instead of per cell
+                gy0 = max(0, ty + row_idx * scale)
+                gy1 = min(size, ty + (row_idx + 1) * scale)
+                if gy0 >= gy1:
+                    continue
                 for bit_idx in range(width):
                     if bits & (1 << (width - 1 - bit_idx)):
-                        for sy in range(scale):
-                            for sx in range(scale):
-                                gx = tx + bit_idx * scale + sx
-                                gy = ty + row_idx * scale + sy
-                                if 0 <= gx < self.size and 0 <= gy < self.size:
-                                    grid[gy][gx] = color
+                        gx0 = max(0, tx + bit_idx * scale)
+                        gx1 = min(size, tx + (bit_idx + 1) * scale)
+                        if gx0 >= gx1:
+                            continue
+                        run = [color] * (gx1 - gx0)
+                        for gy in range(gy0, gy1):
+                            grid[gy][gx0:gx1] = run
             if compact:
                 tx += width * scale
             else:
@@ -2384,11 +2631,14 @@ class PixelArtEditor:
     def _stamp_pixels(self, stamp_grid):
         """Stamp a grid of pixel colors (None means skip) onto self.pixels, pushing undo."""
         self._push_undo()
-        for y in range(self.size):
-            for x in range(self.size):
-                v = stamp_grid[y][x]
+        h = min(len(self.pixels), len(stamp_grid))
+        for y in range(h):
+            row = self.pixels[y]
+            src = stamp_grid[y]
+            for x in range(min(len(row), len(src))):
+                v = src[x]
                 if v is not None:
-                    self.pixels[y][x] = v
+                    row[x] = v
         self.refresh_grid()
 
     def _open_text_dialog(self, e):
@@ -2502,15 +2752,13 @@ class PixelArtEditor:
             ox = int((pos_x.value or "0").strip())
             oy = int((pos_y.value or "0").strip())
             compact = compact_checkbox.value
-            import tempfile
-
             # Preview 1: just the stamp
             if not txt:
                 if preview_img.page:
-                    preview_img.src = None
+                    preview_img.src_base64 = None
                     preview_img.update()
                 if preview_applied_img.page:
-                    preview_applied_img.src = None
+                    preview_applied_img.src_base64 = None
                     preview_applied_img.update()
                 return
             stamp = None
@@ -2525,38 +2773,26 @@ class PixelArtEditor:
                     compact=compact,
                 )
                 img = self._pixels_to_image(stamp)
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                    img.save(tmp.name)
-                    preview_img.src = tmp.name
-                    preview_img.update()
+                preview_img.src_base64 = png_base64(img)
+                preview_img.update()
             except Exception as ex:
                 if preview_img.page:
-                    preview_img.src = None
+                    preview_img.src_base64 = None
                     preview_img.update()
                 status.value = f"Preview error: {ex}"
                 status.update()
             # Preview 2: stamp applied to current image
             if stamp is not None:
                 try:
-                    import copy
-
-                    applied_pixels = copy.deepcopy(self.pixels)
-                    for y in range(self.size):
-                        for x in range(self.size):
-                            v = stamp[y][x]
-                            if v is not None:
-                                applied_pixels[y][x] = v
-                    img2 = self._pixels_to_image(applied_pixels)
-                    with tempfile.NamedTemporaryFile(
-                        suffix=".png", delete=False
-                    ) as tmp2:
-                        img2.save(tmp2.name)
-                        if preview_applied_img.page:
-                            preview_applied_img.src = tmp2.name
-                            preview_applied_img.update()
+                    applied = pixels_to_np(self.pixels, self._hex_to_rgba)
+                    blit_stamp(applied, pixels_to_np(stamp, self._hex_to_rgba), 0, 0)
+                    img2 = np_to_image(applied)
+                    if preview_applied_img.page:
+                        preview_applied_img.src_base64 = png_base64(img2)
+                        preview_applied_img.update()
                 except Exception as ex2:
                     if preview_applied_img.page:
-                        preview_applied_img.src = None
+                        preview_applied_img.src_base64 = None
                         preview_applied_img.update()
                     status.value = f"Applied preview error: {ex2}"
                     status.update()
@@ -2607,15 +2843,13 @@ class PixelArtEditor:
             ox = int((pos_x.value or "0").strip())
             oy = int((pos_y.value or "0").strip())
             compact = compact_checkbox.value
-            import tempfile
-
             # Preview 1: just the stamp
             if not txt:
                 if preview_img.page:
-                    preview_img.src = None
+                    preview_img.src_base64 = None
                     preview_img.update()
                 if preview_applied_img.page:
-                    preview_applied_img.src = None
+                    preview_applied_img.src_base64 = None
                     preview_applied_img.update()
                 return
             stamp = None
@@ -2630,38 +2864,26 @@ class PixelArtEditor:
                     compact=compact,
                 )
                 img = self._pixels_to_image(stamp)
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                    img.save(tmp.name)
-                    preview_img.src = tmp.name
-                    preview_img.update()
+                preview_img.src_base64 = png_base64(img)
+                preview_img.update()
             except Exception as ex:
                 if preview_img.page:
-                    preview_img.src = None
+                    preview_img.src_base64 = None
                     preview_img.update()
                 status.value = f"Preview error: {ex}"
                 status.update()
             # Preview 2: stamp applied to current image
             if stamp is not None:
                 try:
-                    import copy
-
-                    applied_pixels = copy.deepcopy(self.pixels)
-                    for y in range(self.size):
-                        for x in range(self.size):
-                            v = stamp[y][x]
-                            if v is not None:
-                                applied_pixels[y][x] = v
-                    img2 = self._pixels_to_image(applied_pixels)
-                    with tempfile.NamedTemporaryFile(
-                        suffix=".png", delete=False
-                    ) as tmp2:
-                        img2.save(tmp2.name)
-                        if preview_applied_img.page:
-                            preview_applied_img.src = tmp2.name
-                            preview_applied_img.update()
+                    applied = pixels_to_np(self.pixels, self._hex_to_rgba)
+                    blit_stamp(applied, pixels_to_np(stamp, self._hex_to_rgba), 0, 0)
+                    img2 = np_to_image(applied)
+                    if preview_applied_img.page:
+                        preview_applied_img.src_base64 = png_base64(img2)
+                        preview_applied_img.update()
                 except Exception as ex2:
                     if preview_applied_img.page:
-                        preview_applied_img.src = None
+                        preview_applied_img.src_base64 = None
                         preview_applied_img.update()
                     status.value = f"Applied preview error: {ex2}"
                     status.update()
@@ -2834,12 +3056,12 @@ class PixelArtEditor:
             # actual save operation extracted so overwrite confirm can call it
             def _perform_save():
                 logger.debug(f"Saving icon to {path}")
-                # build image and base64 PNG
+                # build image and base64 PNG; the same bytes back the optional .png file
                 img = self._pixels_to_image(self.pixels)
-                import json as _json
 
                 buf = io.BytesIO()
-                img.save(buf, format="PNG")
+                # icons are tiny, so a fast zlib level costs almost nothing in size
+                img.save(buf, format="PNG", compress_level=1)
                 png_bytes = buf.getvalue()
                 png_b64 = base64.b64encode(png_bytes).decode("ascii")
 
@@ -2851,8 +3073,7 @@ class PixelArtEditor:
                 }
 
                 # write JSON file
-                with open(path, "w", encoding="utf-8") as fh:
-                    _json.dump(obj, fh, ensure_ascii=False, indent=2)
+                _write_json(path, obj)
 
                 # optionally write PNG file as well
                 if save_png_checkbox.value:
@@ -2972,45 +3193,21 @@ class PixelArtEditor:
                 if v.lower().endswith(".png"):
                     img = Image.open(p)
                     img2 = img.resize((64, 64))
-                    import tempfile as _tmp
-                    tmpf = _tmp.NamedTemporaryFile(suffix='.png', delete=False)
-                    try:
-                        img2.save(tmpf.name)
-                        preview.src = tmpf.name
-                    finally:
-                        try:
-                            tmpf.close()
-                        except Exception:
-                            pass
+                    preview.src_base64 = png_base64(img2)
                 elif v.lower().endswith(".json"):
                     # parse json package
-                    with open(p, "r", encoding="utf-8") as fh:
-                        obj = json.load(fh)
-                    # if embedded png exists, write a preview file
+                    obj = _read_json(p)
+                    # embedded png is already base64; hand it straight to the preview
                     if isinstance(obj, dict) and obj.get("png_base64"):
-                        try:
-                            b = base64.b64decode(obj["png_base64"])
-                            import tempfile as _tmp
-                            tmpf = _tmp.NamedTemporaryFile(suffix='.png', delete=False)
-                            try:
-                                with open(tmpf.name, "wb") as pf:
-                                    pf.write(b)
-                                preview.src = tmpf.name
-                            finally:
-                                try:
-                                    tmpf.close()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            preview.src = ""
+                        preview.src_base64 = obj["png_base64"]
                     else:
                         # no embedded PNG; render pixels to a small preview if possible
-                        preview.src = ""
+                        preview.src_base64 = None
                 else:
-                    preview.src = ""
+                    preview.src_base64 = None
             except Exception as ex:
                 logger.exception(f"Error loading file preview: {ex}")
-                preview.src = ""
+                preview.src_base64 = None
             preview.update()
 
         dropdown.on_change = on_select
@@ -3029,8 +3226,7 @@ class PixelArtEditor:
                     img = Image.open(p)
                     pixels = self._image_to_pixels(img)
                 elif v.lower().endswith(".json"):
-                    with open(p, "r", encoding="utf-8") as fh:
-                        obj = json.load(fh)
+                    obj = _read_json(p)
                     # restore pixels from known shapes
                     if isinstance(obj, dict):
                         # populate persistent metadata fields so user can edit metadata immediately
@@ -3156,35 +3352,23 @@ class PixelArtEditor:
         self.refresh_grid()
 
     def invert_colors(self, image):
-        """Invert the colors of the image."""
-        return image.point(lambda p: 255 - p)
+        """Invert the colors of the image, leaving alpha untouched."""
+        return Image.fromarray(_invert_rgba(np.array(image.convert("RGBA"))), "RGBA")
 
     def convert_to_grayscale(self, image):
-        """Convert the image to grayscale."""
-        return image.convert("L").convert("RGBA")
+        """Convert the image to grayscale, leaving alpha untouched."""
+        image = image.convert("RGBA")
+        luma = image.convert("L")
+        return Image.merge("RGBA", (luma, luma, luma, image.getchannel("A")))
 
     def adjust_hue(self, image, degrees):
-        def shift_hue(r, g, b, degrees):
-            h, lightness, s = colorsys.rgb_to_hls(r / 255, g / 255, b / 255)
-            h = (h + degrees / 360) % 1
-            r2, g2, b2 = colorsys.hls_to_rgb(h, lightness, s)
-            return int(r2 * 255), int(g2 * 255), int(b2 * 255)
-
-        pixels = image.load()
-        for y in range(image.height):
-            for x in range(image.width):
-                r, g, b, a = pixels[x, y]
-                pixels[x, y] = (*shift_hue(r, g, b, degrees), a)
-        return image
+        """Rotate the hue of every pixel by `degrees`, keeping HLS lightness/saturation and alpha."""
+        return Image.fromarray(_hue_rgba(np.array(image.convert("RGBA")), degrees), "RGBA")
 
     def replace_color(self, image, target_color, replacement_color):
         """Replace all instances of a specific color with another color."""
-        pixels = image.load()
-        for y in range(image.height):
-            for x in range(image.width):
-                if pixels[x, y][:3] == target_color[:3]:
-                    pixels[x, y] = replacement_color
-        return image
+        arr = _replace_rgba(np.array(image.convert("RGBA")), target_color, replacement_color)
+        return Image.fromarray(arr, "RGBA")
 
     def _hex_to_rgba(self, hex_color, alpha=255):
         """Convert a hex color (or simple rgba string) to an (R,G,B,A) tuple of ints 0-255.
@@ -3197,96 +3381,29 @@ class PixelArtEditor:
         """
         if not hex_color:
             return (0, 0, 0, alpha)
-        s = str(hex_color).strip()
-        # rgba(...) format
-        if s.lower().startswith("rgba"):
-            try:
-                nums = re.findall(r"[0-9]*\.?[0-9]+", s)
-                if len(nums) >= 3:
-                    r = int(float(nums[0]))
-                    g = int(float(nums[1]))
-                    b = int(float(nums[2]))
-                    a = (
-                        int(float(nums[3]) * 255)
-                        if len(nums) > 3 and float(nums[3]) <= 1
-                        else (int(float(nums[3])) if len(nums) > 3 else alpha)
-                    )
-                    return (r, g, b, a)
-            except Exception:
-                return (0, 0, 0, alpha)
-
-        # strip leading '#'
-        if s.startswith("#"):
-            s = s[1:]
-
-        try:
-            if len(s) == 3:
-                r = int(s[0] * 2, 16)
-                g = int(s[1] * 2, 16)
-                b = int(s[2] * 2, 16)
-                return (r, g, b, alpha)
-            if len(s) == 4:  # rgba in hex short form
-                r = int(s[0] * 2, 16)
-                g = int(s[1] * 2, 16)
-                b = int(s[2] * 2, 16)
-                a = int(s[3] * 2, 16)
-                return (r, g, b, a)
-            if len(s) == 6:
-                r = int(s[0:2], 16)
-                g = int(s[2:4], 16)
-                b = int(s[4:6], 16)
-                return (r, g, b, alpha)
-            if len(s) == 8:
-                r = int(s[0:2], 16)
-                g = int(s[2:4], 16)
-                b = int(s[4:6], 16)
-                a = int(s[6:8], 16)
-                return (r, g, b, a)
-            # try comma/space separated numbers
-            parts = [p for p in re.split(r"[,\s]+", s) if p]
-            if len(parts) >= 3:
-                r = int(float(parts[0]))
-                g = int(float(parts[1]))
-                b = int(float(parts[2]))
-                a = int(float(parts[3])) if len(parts) > 3 else alpha
-                return (r, g, b, a)
-        except Exception:
-            return (0, 0, 0, alpha)
-
-        return (0, 0, 0, alpha)
+        # hex and rgba() parsing is case-insensitive, so fold case to share cache entries
+        key = str(hex_color).strip().lower()
+        if alpha == 255:
+            rgba = _PRESET_RGBA.get(key)
+            if rgba is not None:
+                return rgba
+        return _parse_color(key, alpha)
 
     def apply_gradient_overlay(self, image, gradient):
-        """Apply a gradient overlay to the image."""
-        overlay = Image.new("RGBA", image.size, gradient)
-        return Image.alpha_composite(image, overlay)
+        """Apply a gradient overlay to the image (same result as alpha_composite with a solid overlay)."""
+        return Image.fromarray(_overlay_rgba(np.array(image.convert("RGBA")), gradient), "RGBA")
 
     def adjust_opacity(self, image, opacity):
         """Adjust the opacity of the image."""
-        alpha = image.split()[-1]
-        alpha = alpha.point(lambda p: int(p * opacity))
-        image.putalpha(alpha)
-        return image
+        return Image.fromarray(_opacity_rgba(np.array(image.convert("RGBA")), opacity), "RGBA")
 
     def apply_sepia_tone(self, image):
-        """Apply a sepia tone to the image."""
-        sepia = [
-            (
-                r * 0.393 + g * 0.769 + b * 0.189,
-                r * 0.349 + g * 0.686 + b * 0.168,
-                r * 0.272 + g * 0.534 + b * 0.131,
-            )
-            for r, g, b in image.getdata()
-        ]
-        image.putdata([tuple(map(int, p)) for p in sepia])
-        return image
+        """Apply a sepia tone to the image, leaving alpha untouched."""
+        return Image.fromarray(_sepia_rgba(np.array(image.convert("RGBA"))), "RGBA")
 
     def pixelate(self, image, pixel_size):
         """Pixelate the image by enlarging each pixel."""
-        small = image.resize(
-            (image.width // pixel_size, image.height // pixel_size),
-            Image.Resampling.NEAREST,
-        )
-        return small.resize(image.size, Image.Resampling.NEAREST)
+        return Image.fromarray(_pixelate_rgba(np.array(image.convert("RGBA")), pixel_size), "RGBA")
 
     def quantize_colors(self, image, num_colors):
         """Reduce the number of colors in the image."""
@@ -3294,8 +3411,6 @@ class PixelArtEditor:
 
     def adjust_brightness_contrast_region(self, image, region, brightness, contrast):
         """Adjust brightness and contrast for a specific region."""
-        from PIL import ImageEnhance
-
         cropped = image.crop(region)
         cropped = ImageEnhance.Brightness(cropped).enhance(brightness)
         cropped = ImageEnhance.Contrast(cropped).enhance(contrast)
@@ -3303,80 +3418,79 @@ class PixelArtEditor:
         return image
 
     # UI handlers for the color manipulation buttons (ensure these are present)
-    def on_invert_colors(self, e):
-        img = self._pixels_to_image(self.pixels)
-        img = self.invert_colors(img)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
+    def _run_filter(self, compute):
+        """Replace the grid with `compute(pixels)`, recording an undo snapshot first.
 
-        self.refresh_grid()
+        Runs synchronously in the calling handler. Flet dispatches handlers on a thread
+        pool, so the lock keeps two filters (and kernels sharing scratch buffers) from
+        overlapping.
+        """
+        with self._filter_lock:
+            try:
+                pixels = compute(self.pixels)
+            except Exception:
+                logger.exception("PixelArtEditor: filter failed")
+                return
+            # close any open stroke so later painting doesn't record into an entry below this one
+            self._end_stroke()
+            self._push_undo()
+            self.pixels = pixels
+        try:
+            self.refresh_grid()
+        except Exception:
+            logger.exception("PixelArtEditor: refresh after filter failed")
+
+    def _apply_rgba_filter(self, kernel, *args):
+        """Run an in-place RGBA array kernel over the grid without a PIL round trip."""
+        self._run_filter(
+            lambda pixels: self._rgba_to_pixels(kernel(self._pixels_to_rgba(pixels), *args))
+        )
+
+    def _apply_image_filter(self, fn, *args):
+        """Run a PIL-based filter `fn(image, *args)` over the grid."""
+        self._run_filter(
+            lambda pixels: self._image_to_pixels(fn(self._pixels_to_image(pixels), *args))
+        )
+
+    def on_invert_colors(self, e):
+        self._apply_rgba_filter(_invert_rgba)
 
     def on_convert_to_grayscale(self, e):
-        img = self._pixels_to_image(self.pixels)
-        img = self.convert_to_grayscale(img)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_image_filter(self.convert_to_grayscale)
 
     def on_adjust_hue(self, e, degrees):
-        img = self._pixels_to_image(self.pixels)
-        img = self.adjust_hue(img, degrees)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_rgba_filter(_hue_rgba, degrees)
 
     def on_replace_color(self, e, target_color, replacement_color):
-        img = self._pixels_to_image(self.pixels)
-        img = self.replace_color(
-            img, self._hex_to_rgba(target_color), self._hex_to_rgba(replacement_color)
+        self._apply_rgba_filter(
+            _replace_rgba,
+            self._hex_to_rgba(target_color),
+            self._hex_to_rgba(replacement_color),
         )
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
 
     def on_apply_gradient_overlay(self, e, gradient_color):
-        img = self._pixels_to_image(self.pixels)
-        img = self.apply_gradient_overlay(img, self._hex_to_rgba(gradient_color))
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_rgba_filter(_overlay_rgba, self._hex_to_rgba(gradient_color))
 
     def on_adjust_opacity(self, e, opacity):
-        img = self._pixels_to_image(self.pixels)
-        img = self.adjust_opacity(img, opacity)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_rgba_filter(_opacity_rgba, opacity)
 
     def on_apply_sepia_tone(self, e):
-        img = self._pixels_to_image(self.pixels)
-        img = self.apply_sepia_tone(img)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        # filters are serialised by _filter_lock, so one buffer pair is enough
+        if self._sepia_scratch is None:
+            shape = (self.size, self.size, 3)
+            self._sepia_scratch = (np.empty(shape, np.float32), np.empty(shape, np.float32))
+        self._apply_rgba_filter(_sepia_rgba, self._sepia_scratch)
 
     def on_pixelate(self, e, pixel_size):
-        img = self._pixels_to_image(self.pixels)
-        img = self.pixelate(img, pixel_size)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_rgba_filter(_pixelate_rgba, pixel_size)
 
     def on_quantize_colors(self, e, num_colors):
-        img = self._pixels_to_image(self.pixels)
-        img = self.quantize_colors(img, num_colors)
-        if hasattr(img, "convert"):
-            img = img.convert("RGBA")
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_image_filter(self.quantize_colors, num_colors)
 
     def on_adjust_brightness_contrast_region(self, e, region, brightness, contrast):
-        img = self._pixels_to_image(self.pixels)
-        img = self.adjust_brightness_contrast_region(img, region, brightness, contrast)
-        self._push_undo()
-        self.pixels = self._image_to_pixels(img)
-        self.refresh_grid()
+        self._apply_image_filter(
+            self.adjust_brightness_contrast_region, region, brightness, contrast
+        )
 
     def control(self):
         return self.container
@@ -3472,12 +3586,13 @@ class PixelArtEditor:
         if getattr(self, "_grid_built", False):
             return
         try:
-            # build the grid controls
+            # build the grid controls, keeping direct [y][x] references to the cells
+            self._cells = [
+                [self.make_pixel(x, y) for x in range(self.size)]
+                for y in range(self.size)
+            ]
             self.grid = ft.Column(
-                [
-                    ft.Row([self.make_pixel(x, y) for x in range(self.size)], spacing=0)
-                    for y in range(self.size)
-                ],
+                [ft.Row(row, spacing=0) for row in self._cells],
                 spacing=0,
             )
             # Wrap the grid in a GestureDetector to reliably capture pan/drag start and end
@@ -3485,10 +3600,10 @@ class PixelArtEditor:
 
                 def _gd_pan_start(ev):
                     try:
-                        # start of a pan/drag: push one undo snapshot for the whole drag
+                        # start of a pan/drag: one undo entry covers the whole drag
                         try:
-                            if not getattr(self, '_drag_painting', False):
-                                self._push_undo()
+                            if getattr(self, "_stroke_delta", None) is None:
+                                self._begin_stroke()
                         except Exception:
                             pass
                         self._mouse_down = True
@@ -3516,6 +3631,7 @@ class PixelArtEditor:
                     try:
                         self._mouse_down = False
                         self._drag_painting = False
+                        self._end_stroke()
                         logger.debug(
                             "GestureDetector: pan_end; cleared _mouse_down/_drag_painting"
                         )
@@ -3527,11 +3643,8 @@ class PixelArtEditor:
                         self._mouse_down = True
                         # start a drag session so first hovered cell is painted
                         try:
-                            if not getattr(self, '_drag_painting', False):
-                                try:
-                                    self._push_undo()
-                                except Exception:
-                                    pass
+                            if getattr(self, "_stroke_delta", None) is None:
+                                self._begin_stroke()
                         except Exception:
                             pass
                         self._drag_painting = True
@@ -3547,6 +3660,7 @@ class PixelArtEditor:
                         # treat tap up as end of mouse press
                         self._mouse_down = False
                         self._drag_painting = False
+                        self._end_stroke()
                     except Exception:
                         pass
 
@@ -3555,6 +3669,7 @@ class PixelArtEditor:
                         # pointer left the GestureDetector area: clear any lingering flags
                         self._mouse_down = False
                         self._drag_painting = False
+                        self._end_stroke()
                         logger.debug(
                             "GestureDetector: on_exit; cleared _mouse_down/_drag_painting"
                         )
@@ -3636,15 +3751,18 @@ class PixelArtEditor:
 
             # Paint the cell programmatically (bypass per-cell click)
             try:
-                # push undo once at drag start
-                if not getattr(self, "_drag_painting", False):
-                    self._push_undo()
+                # open one undo entry per drag and record each cell's value before its first change
+                if getattr(self, "_stroke_delta", None) is None:
+                    self._begin_stroke()
                 self._drag_painting = True
                 self._mouse_down = True
+                prior = self.pixels[cy][cx]
+                if prior != self.current_color:
+                    self._stroke_delta.setdefault((cx, cy), prior)
                 self.pixels[cy][cx] = self.current_color
                 # update cell control if grid exists
                 try:
-                    cell = self.grid.controls[cy].controls[cx]
+                    cell = self._cells[cy][cx]
                     if self.current_color is None:
                         cell.bgcolor = None
                         try:
@@ -3659,10 +3777,7 @@ class PixelArtEditor:
                     else:
                         cell.content = None
                         cell.bgcolor = self.current_color
-                    try:
-                        cell.update()
-                    except Exception:
-                        pass
+                    self._queue_cell_update(cell)
                 except Exception:
                     pass
             except Exception:
@@ -3670,6 +3785,31 @@ class PixelArtEditor:
         except Exception:
             pass
 
+    def _queue_cell_update(self, cell, delay=0.016):
+        """Send `cell` to the renderer with the other cells painted in the same ~frame."""
+        # keyed by id() so it does not rely on controls being hashable
+        self._dirty_cells[id(cell)] = cell
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self._flush_dirty_cells)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_dirty_cells(self):
+        cells = self._dirty_cells
+        self._dirty_cells = {}
+        self._flush_timer = None
+        if not cells:
+            return
+        try:
+            # one batched message instead of a cell.update() per hovered cell
+            self.page.update(*cells.values())
+        except Exception:
+            for cell in cells.values():
+                try:
+                    cell.update()
+                except Exception:
+                    pass
+
     #
     # ...existing code...
     class _SmallDialog:
@@ -3926,15 +4066,45 @@ class PixelArtEditor:
     # wiring is invoked from _build via self._wire_dialogs()
 
     # Undo / Redo logic
+    # Undo entries are either a full snapshot of the grid or, for paint strokes,
+    # a dict mapping (x, y) to the cell's previous value.
     def _push_undo(self):
-        # push a deep copy of pixels
-        self._undo_stack.append(copy.deepcopy(self.pixels))
+        # cells are immutable strings/None, so copying the rows is a full snapshot
+        self._push_undo_entry([row[:] for row in self.pixels])
+
+    def _push_undo_entry(self, entry):
+        self._undo_stack.append(entry)
         # limit stack size
         if len(self._undo_stack) > 50:
             self._undo_stack.pop(0)
         # clear redo when new action performed
         self._redo_stack.clear()
 
+    def _begin_stroke(self):
+        # _paint_from_event fills this in as the drag touches cells
+        self._stroke_delta = {}
+        self._push_undo_entry(self._stroke_delta)
+
+    def _end_stroke(self):
+        delta = getattr(self, "_stroke_delta", None)
+        self._stroke_delta = None
+        # drop entries for strokes that never changed a cell
+        if delta is not None and not delta and self._undo_stack and self._undo_stack[-1] is delta:
+            self._undo_stack.pop()
+
+    def _apply_undo_entry(self, entry):
+        """Restore the state recorded in `entry` and return the entry that reverts it."""
+        if isinstance(entry, dict):
+            inverse = {}
+            for (x, y), prior in entry.items():
+                inverse[(x, y)] = self.pixels[y][x]
+                self.pixels[y][x] = prior
+            return inverse
+        # the live grid is replaced rather than edited, so it can move to the other stack as-is
+        current = self.pixels
+        self.pixels = entry
+        return current
+
     def _can_undo(self):
         return len(self._undo_stack) > 0
 
@@ -3942,17 +4112,17 @@ class PixelArtEditor:
         return len(self._redo_stack) > 0
 
     def on_undo(self, e):
+        self._end_stroke()
         if not self._can_undo():
             return
-        self._redo_stack.append(copy.deepcopy(self.pixels))
-        self.pixels = self._undo_stack.pop()
+        self._redo_stack.append(self._apply_undo_entry(self._undo_stack.pop()))
         self.refresh_grid()
 
     def on_redo(self, e):
+        self._end_stroke()
         if not self._can_redo():
             return
-        self._undo_stack.append(copy.deepcopy(self.pixels))
-        self.pixels = self._redo_stack.pop()
+        self._undo_stack.append(self._apply_undo_entry(self._redo_stack.pop()))
         self.refresh_grid()
 
     # wrap mutating operations to push undo state
@@ -0,0 +1,155 @@
+"""Packed pixel-grid helpers shared by the icon editor and its stamp/import dialogs.
+
+Grids are handled as ARGB uint32 arrays of shape (h, w) where 0 (alpha == 0) stands
+for a transparent/None cell. The editor's list-of-rows of hex strings is only used
+at the boundary.
+"""
+import base64
+import io
+
+import numpy as np
+from PIL import Image
+
+
+def pixels_to_np(pixels, to_rgba):
+    """Pack a list-of-rows hex grid into an ARGB uint32 array using `to_rgba` to parse colours."""
+    h = len(pixels)
+    w = max((len(r) for r in pixels), default=0)
+    arr = np.zeros((h, w), dtype=np.uint32)
+    lut = {None: 0}
+    for y, row in enumerate(pixels):
+        packed = []
+        for v in row:
+            u = lut.get(v) if isinstance(v, str) or v is None else 0
+            if u is None:
+                try:
+                    r, g, b, a = to_rgba(v)
+                    u = ((a & 0xFF) << 24) | ((r & 0xFF) << 16) | ((g & 0xFF) << 8) | (b & 0xFF) if a else 0
+                except Exception:
+                    u = 0
+                lut[v] = u
+            packed.append(u)
+        arr[y, :len(packed)] = packed
+    return arr
+
+
+def np_to_pixels(arr):
+    """Unpack an ARGB uint32 array into a list-of-rows of hex strings (None for transparent)."""
+    uniq, inv = np.unique(arr, return_inverse=True)
+    names = []
+    for u in uniq.tolist():
+        a = u >> 24
+        if a == 0:
+            names.append(None)
+        elif a == 255:
+            names.append(f"#{(u >> 16) & 0xFF:02X}{(u >> 8) & 0xFF:02X}{u & 0xFF:02X}")
+        else:
+            names.append(f"#{(u >> 16) & 0xFF:02X}{(u >> 8) & 0xFF:02X}{u & 0xFF:02X}{a:02X}")
+    # gather the per-colour strings with one object-array index; tolist() then builds the rows in C
+    return np.array(names, dtype=object)[inv.reshape(arr.shape)].tolist()
+
+
+def pack_rgba(rgba):
+    """Pack an (h, w, 4) uint8 RGBA array into ARGB uint32, zeroing fully transparent cells."""
+    a = rgba.astype(np.uint32)
+    packed = (a[..., 3] << 24) | (a[..., 0] << 16) | (a[..., 1] << 8) | a[..., 2]
+    packed[a[..., 3] == 0] = 0
+    return packed
+
+
+def unpack_rgba(arr):
+    """Split an ARGB uint32 array into an (h, w, 4) uint8 RGBA array."""
+    rgba = np.empty(arr.shape + (4,), dtype=np.uint8)
+    rgba[..., 0] = (arr >> 16) & 0xFF
+    rgba[..., 1] = (arr >> 8) & 0xFF
+    rgba[..., 2] = arr & 0xFF
+    rgba[..., 3] = arr >> 24
+    return rgba
+
+
+def image_to_np(img):
+    return pack_rgba(np.asarray(img.convert('RGBA')))
+
+
+def np_to_image(arr):
+    return Image.fromarray(unpack_rgba(arr), 'RGBA')
+
+
+def _nearest_indices(n_src, n_dst):
+    """Source indices Pillow's NEAREST resize samples along one axis.
+
+    Pillow steps the sample position by n_src/n_dst from half a step in, accumulating
+    in double precision; add.accumulate reproduces that exactly, rounding included.
+    """
+    step = n_src / n_dst
+    pos = np.full(n_dst, step)
+    pos[0] = step * 0.5
+    return np.minimum(np.add.accumulate(pos).astype(np.intp), n_src - 1)
+
+
+def resize_nearest(arr, size):
+    """NEAREST-resize a (h, w, ...) array to `size` (w, h), matching Image.resize(..., NEAREST)."""
+    nw, nh = size
+    h, w = arr.shape[:2]
+    return arr[_nearest_indices(h, nh)[:, None], _nearest_indices(w, nw)]
+
+
+def blit_stamp(dst, src, ox, oy):
+    """Copy the opaque cells of `src` onto `dst` at offset (ox, oy), clipped to `dst`'s bounds."""
+    dh, dw = dst.shape
+    sh, sw = src.shape
+    tx0, ty0 = max(0, ox), max(0, oy)
+    tx1, ty1 = min(dw, ox + sw), min(dh, oy + sh)
+    if tx0 >= tx1 or ty0 >= ty1:
+        return dst
+    region = src[ty0 - oy:ty1 - oy, tx0 - ox:tx1 - ox]
+    mask = (region >> 24) != 0
+    dst[ty0:ty1, tx0:tx1][mask] = region[mask]
+    return dst
+
+
+def blit_scaled(dst, src, scale, ox, oy, key_rgb=None):
+    """Blit `src` magnified by the integer `scale` onto `dst`, optionally chroma-keying `key_rgb`.
+
+    Equivalent to chroma_key + np.repeat + blit_stamp, but only the cells that land
+    inside `dst` are gathered, so the scaled stamp is never materialised.
+    """
+    dh, dw = dst.shape
+    sh, sw = src.shape
+    tx0, ty0 = max(0, ox), max(0, oy)
+    tx1, ty1 = min(dw, ox + sw * scale), min(dh, oy + sh * scale)
+    if tx0 >= tx1 or ty0 >= ty1:
+        return dst
+    sy = (np.arange(ty0, ty1) - oy) // scale
+    sx = (np.arange(tx0, tx1) - ox) // scale
+    region = src[np.ix_(sy, sx)]
+    mask = (region >> 24) != 0
+    if key_rgb is not None:
+        r, g, b = key_rgb
+        target = ((r & 0xFF) << 16) | ((g & 0xFF) << 8) | (b & 0xFF)
+        mask &= (region & 0xFFFFFF) != target
+    dst[ty0:ty1, tx0:tx1][mask] = region[mask]
+    return dst
+
+
+def chroma_key(arr, rgb):
+    """Make every opaque cell of `arr` whose RGB equals `rgb` transparent, in place.
+
+    Alpha is ignored when matching, so semi-transparent cells of the key colour
+    are cleared too.
+    """
+    r, g, b = rgb
+    target = ((r & 0xFF) << 16) | ((g & 0xFF) << 8) | (b & 0xFF)
+    arr[((arr >> 24) != 0) & ((arr & 0xFFFFFF) == target)] = 0
+    return arr
+
+
+def png_base64(img, compress_level=1):
+    """Encode `img` as a base64 PNG for ft.Image.src_base64.
+
+    Previews are rebuilt on every input change and never hit disk, so favour
+    encode speed over size.
+    """
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', optimize=False, compress_level=compress_level)
+    return base64.b64encode(buf.getvalue()).decode()
@@ -1,16 +1,192 @@
 import flet as ft
 from loguru import logger
 import numpy as np
-import matplotlib.pyplot as plt
-import io
-import base64
+from PIL import Image, ImageDraw, ImageFont
+import atexit
 import contextlib
+import functools
 import wave
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 WAVEFORM_DIALOG = None
 
+# rendered waveform preview (width, height); one peak column per pixel
+WAVEFORM_SIZE = (320, 100)
+
+# (filepath, mtime, gain_db) -> (max_amp, avg_amp, lufs, png_path), oldest first, so
+# returning to a gain already shown (or reopening the dialog) skips the render and LUFS pass
+_PREVIEW_CACHE = {}
+_PREVIEW_CACHE_MAX = 512
+_PREVIEW_LOCK = threading.Lock()
+
+# wav path -> (mtime, framerate, n_frames), so reopening the dialog skips the RIFF header parse
+_WAV_META_CACHE = {}
+
+
+def _wav_meta(path):
+    """Return (framerate, n_frames) from a WAV header, cached until the file's mtime changes."""
+    mtime = os.path.getmtime(path)
+    cached = _WAV_META_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        with contextlib.closing(wave.open(path, 'rb')) as wf:
+            cached = _WAV_META_CACHE[path] = (mtime, wf.getframerate(), wf.getnframes())
+    return cached[1], cached[2]
+
+
+# samples reduced per block in _waveform_peaks; small enough (1 MiB of float32) that the
+# max pass finds the block still in cache after the min pass
+_PEAK_BLOCK_SAMPLES = 1 << 18
+
+
+def _waveform_peaks(audio, n_cols):
+    """Return per-column (mins, maxs) of `audio` split into `n_cols` near-equal chunks.
+
+    Columns narrower than one sample repeat the sample they start on.
+    """
+    starts = (np.arange(n_cols) * len(audio)) // n_cols
+    if len(audio) <= _PEAK_BLOCK_SAMPLES:
+        return np.minimum.reduceat(audio, starts), np.maximum.reduceat(audio, starts)
+    # Both reductions over a whole multi-minute track stream it from RAM twice; doing them
+    # block by block reads it once
+    mins = np.empty(n_cols, dtype=audio.dtype)
+    maxs = np.empty(n_cols, dtype=audio.dtype)
+    step = max(1, _PEAK_BLOCK_SAMPLES * n_cols // len(audio))
+    bounds = np.append(starts, len(audio))
+    for c in range(0, n_cols, step):
+        end = min(c + step, n_cols)
+        block = audio[bounds[c]:bounds[end]]
+        offsets = starts[c:end] - bounds[c]
+        np.minimum.reduceat(block, offsets, out=mins[c:end])
+        np.maximum.reduceat(block, offsets, out=maxs[c:end])
+    return mins, maxs
+
+
+@functools.lru_cache(maxsize=1)
+def _waveform_template():
+    """Blank preview (white with a grey zero line), row-index column and label font.
+
+    Shared by every render; callers copy the canvas rather than drawing on it.
+    """
+    w, h = WAVEFORM_SIZE
+    canvas = np.full((h, w, 3), 255, dtype=np.uint8)
+    canvas[h // 2, :] = (200, 200, 200)
+    canvas.flags.writeable = False
+    return canvas, np.arange(h)[:, None], ImageFont.load_default()
+
+
+def _render_waveform_png(mins, maxs, title, duration, fp, gain=1.0):
+    """Rasterise min/max peak columns (amplitude -1..1) into a PNG written to `fp` (path or binary file).
+
+    `gain` is a linear factor folded into the pixel scale, so callers never rescale the peaks.
+    """
+    w, h = WAVEFORM_SIZE
+    mid = h // 2
+    scale = (mid - 2) * gain
+    template, rows, font = _waveform_template()
+    top = np.clip(np.round(mid - maxs * scale), 0, h - 1).astype(np.intp)
+    bottom = np.clip(np.round(mid - mins * scale), 0, h - 1).astype(np.intp)
+    canvas = template.copy()
+    # each column is one vertical span from its max peak down to its min peak
+    canvas[(rows >= top) & (rows <= bottom)] = (0, 0, 255)
+    img = Image.fromarray(canvas, 'RGB')
+    draw = ImageDraw.Draw(img)
+    draw.text((3, 1), title, fill=(0, 0, 0), font=font)
+    draw.text((3, h - 12), f"{duration:.1f} s", fill=(96, 96, 96), font=font)
+    # flat-colour previews barely shrink at higher zlib levels, so favour encode speed
+    img.save(fp, 'PNG', compress_level=1)
+
+
+def _track_base(audio, framerate, max_amp=None, avg_amp=None, lufs=None):
+    """Return (peak mins, peak maxs, max_amp, avg_amp, lufs, duration) of `audio` at 0 dB."""
+    if max_amp is None or avg_amp is None:
+        abs_audio = np.abs(audio)
+        max_amp, avg_amp = float(np.max(abs_audio)), float(np.mean(abs_audio))
+    return (*_waveform_peaks(audio, WAVEFORM_SIZE[0]), max_amp, avg_amp, lufs, len(audio) / framerate)
+
+
+def _track_preview(filepath, framerate, gain_db, base, load_audio):
+    """Return (max_amp, avg_amp, lufs, png_path) for `filepath` at `gain_db`, rendering on a cache miss.
+
+    `base` is the track's `_track_base`; `load_audio()` is only called when the base has
+    no LUFS to offset by the gain. Safe to call from worker threads.
+    """
+    from waveform_utils import integrated_lufs
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        mtime = None
+    key = (filepath, mtime, round(gain_db, 2))
+    with _PREVIEW_LOCK:
+        cached = _PREVIEW_CACHE.pop(key, None)
+    if cached is None or not os.path.exists(cached[3]):
+        mins, maxs, max0, avg0, lufs0, duration = base
+        # a linear gain only rescales the peaks and amplitude stats
+        k = 10 ** (gain_db / 20.0)
+        max_amp = max0 * k
+        avg_amp = avg0 * k
+        # integrated loudness shifts by exactly gain_db, so only measure when there's no base value
+        if lufs0 is not None:
+            lufs = lufs0 + gain_db
+        else:
+            lufs = integrated_lufs(load_audio() * k, framerate)
+        # encode straight into the descriptor mkstemp opened rather than reopening by name
+        fd, tmp_path = tempfile.mkstemp(suffix='.png')
+        with os.fdopen(fd, 'wb') as fh:
+            _render_waveform_png(mins, maxs, os.path.basename(filepath), duration, fh, gain=k)
+        cached = (max_amp, avg_amp, lufs, tmp_path)
+    with _PREVIEW_LOCK:
+        # re-insert so the dict stays in least-recently-used order
+        _PREVIEW_CACHE[key] = cached
+        while len(_PREVIEW_CACHE) > _PREVIEW_CACHE_MAX:
+            _unlink_quietly(_PREVIEW_CACHE.pop(next(iter(_PREVIEW_CACHE)))[3])
+    return cached
+
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@atexit.register
+def _remove_preview_files():
+    """Delete every preview PNG still referenced by the cache."""
+    with _PREVIEW_LOCK:
+        for entry in _PREVIEW_CACHE.values():
+            _unlink_quietly(entry[3])
+        _PREVIEW_CACHE.clear()
+
+def save_pending_gain_adjustments(gain_adjusted_files, waveform_cache, audio_adjust_utils):
+    """Write the gain-adjusted audio for entries the waveform dialog only marked dirty.
+
+    Fills in each entry's temp_path; returns a list of per-file error strings.
+    """
+    errors = []
+    for filepath, info in list(gain_adjusted_files.items()):
+        if not info.get('dirty'):
+            continue
+        try:
+            if audio_adjust_utils is None:
+                raise RuntimeError("audio_adjust_utils could not be loaded")
+            from waveform_utils import audio_stats
+            audio, _, _, _, ext, _ = audio_stats(filepath, waveform_cache)
+            if audio is None:
+                raise RuntimeError("could not decode audio")
+            framerate = _wav_meta(filepath)[0] if ext == '.wav' else 44100
+            gain_db = info['gain']
+            info['temp_path'] = getattr(audio_adjust_utils, "save_adjusted_audio")(audio * (10 ** (gain_db / 20.0)), framerate, ext, filepath, gain_db)
+            info['dirty'] = False
+        except Exception as ex:
+            logger.error(f"Failed to save gain-adjusted audio for {filepath}: {ex}")
+            errors.append(f"{os.path.basename(filepath)}: {ex}")
+    return errors
+
+
 def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files, audio_adjust_utils, waveform_cache):
     files = [getattr(row, 'filename', None) for row in file_rows_column.controls if getattr(row, 'filename', None)]
     if not files:
@@ -18,10 +194,22 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
         return
     if not hasattr(page, '_track_gains'):
         page._track_gains = {}
-    progress_text = ft.Text(f"Calculating waveform data... 0/{len(files)}", size=14)
+    from waveform_utils import audio_stats, batch_audio_stats, load_waveform_summary, save_waveform_summary
+    n_cols = WAVEFORM_SIZE[0]
+    # files whose peaks/stats were saved by an earlier session need no decode just to be shown
+    summaries = {}
+    for filepath in files:
+        summary = load_waveform_summary(filepath, n_cols)
+        if summary is not None:
+            summaries[filepath] = summary
+    to_decode = [f for f in files if f not in summaries]
+
+    # One progress dialog serves every long step in this popup; only its text and bar change
+    progress_title = ft.Text()
+    progress_text = ft.Text(size=14)
     progress_bar = ft.ProgressBar(width=300, value=0)
     progress_dlg = ft.AlertDialog(
-        title=ft.Text("Generating Waveforms"),
+        title=progress_title,
         content=ft.Column([
             progress_text,
             progress_bar
@@ -29,16 +217,37 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
         actions=[],
         modal=True
     )
-    page.open(progress_dlg)
-    page.update()
+    progress_pushed = {'at': 0.0}
 
-    def progress_callback(completed, total):
-        progress_text.value = f"Calculating waveform data... {completed}/{total}"
+    def show_progress(title, msg, value=0):
+        """Open the progress dialog; `value=None` shows an indeterminate bar."""
+        progress_title.value = title
+        progress_text.value = msg
+        progress_bar.value = value
+        progress_pushed['at'] = time.monotonic()
+        page.open(progress_dlg)
+        page.update()
+
+    def set_progress(completed, total, msg):
+        """Update the progress dialog, sending it to the client at most every 50 ms and on the last step."""
+        progress_text.value = msg
         progress_bar.value = completed / total if total else 0
+        now = time.monotonic()
+        if completed >= total or now - progress_pushed['at'] >= 0.05:
+            progress_pushed['at'] = now
+            page.update()
+
+    def hide_progress():
+        page.close(progress_dlg)
         page.update()
 
-    from waveform_utils import batch_audio_stats
-    stats_results = batch_audio_stats(files, waveform_cache, progress_callback=progress_callback)
+    show_progress("Generating Waveforms", f"Calculating waveform data... 0/{len(to_decode)}")
+
+    def progress_callback(completed, total):
+        set_progress(completed, total, f"Calculating waveform data... {completed}/{total}")
+
+    stats_results = batch_audio_stats(to_decode, waveform_cache, progress_callback=progress_callback)
+    decoded = {stat[5]: stat for stat in stats_results if stat[0] is not None}
     page.update()
 
     skipped_files = []
@@ -56,121 +265,120 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
                 reason = "Could not decode audio or file is empty/corrupt."
             skipped_files.append(f"{os.path.basename(filepath) or filepath}: {reason}")
 
-    def plot_and_stats(audio, framerate, ext, filepath, gain_db=0.0):
-        import pyloudnorm as pyln
-        audio_adj = audio * (10 ** (gain_db / 20.0))
-        max_amp = float(np.max(np.abs(audio_adj)))
-        avg_amp = float(np.mean(np.abs(audio_adj)))
-        try:
-            meter = pyln.Meter(framerate)
-            lufs = float(meter.integrated_loudness(audio_adj))
-        except Exception:
-            lufs = None
-        max_points = 2000
-        n = len(audio_adj)
-        if n > max_points:
-            idx = np.linspace(0, n - 1, max_points).astype(int)
-            audio_plot = audio_adj[idx]
-        else:
-            audio_plot = audio_adj
-        if ext == '.wav':
-            with contextlib.closing(wave.open(filepath, 'rb')) as wf:
-                framerate = wf.getframerate()
-                n_frames = wf.getnframes()
-                times = np.linspace(0, n_frames / framerate, num=n)
-        else:
-            framerate = 44100
-            times = np.linspace(0, n / framerate, num=n)
-        if n > max_points:
-            times = times[idx]
-        fig, ax = plt.subplots(figsize=(4, 1.2))
-        ax.plot(times, audio_plot, color='blue')
-        ax.set_title(os.path.basename(filepath), fontsize=8)
-        ax.set_xlabel('Time (s)', fontsize=7)
-        ax.set_ylabel('Amplitude', fontsize=7)
-        ax.tick_params(axis='both', which='major', labelsize=6)
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        plt.close(fig)
-        buf.seek(0)
-        img_b64 = base64.b64encode(buf.read()).decode('utf-8')
-        fd, tmp_path = tempfile.mkstemp(suffix='.png')
-        os.close(fd)
-        with open(tmp_path, 'wb') as tmpfile:
-            tmpfile.write(base64.b64decode(img_b64))
+    def show_preview(preview, label, warning, img):
+        """Write a `_track_preview` result into a track's existing label, warning and image."""
+        max_amp, avg_amp, lufs, tmp_path = preview
         lufs_str = f"LUFS: {lufs:.2f} dB" if lufs is not None else "LUFS: (unavailable)"
-        label = ft.Text(f"Max amplitude: {max_amp:.2f}   Average amplitude: {avg_amp:.2f}   {lufs_str}", size=10, color=ft.Colors.BLUE)
-        warning = None
+        label.value = f"Max amplitude: {max_amp:.2f}   Average amplitude: {avg_amp:.2f}   {lufs_str}"
+        warning.visible = lufs is not None and lufs > -16
         if lufs is not None:
             if lufs > -9:
-                warning = ft.Text("Warning: LUFS is high! Track may be too loud for streaming (-9 dB or higher)", size=10, color=ft.Colors.RED)
+                warning.value = "Warning: LUFS is high! Track may be too loud for streaming (-9 dB or higher)"
+                warning.color = ft.Colors.RED
             elif lufs > -16:
-                warning = ft.Text("Warning: LUFS is moderately high (-16 dB to -9 dB)", size=10, color=ft.Colors.YELLOW_900)
-        return label, warning, tmp_path
+                warning.value = "Warning: LUFS is moderately high (-16 dB to -9 dB)"
+                warning.color = ft.Colors.YELLOW_900
+        img.src = tmp_path
 
-    per_track = []
-    n_images = 0
+    def get_audio(filepath):
+        # waveform_cache is the only owner of decoded audio; the dialog holds paths
+        return audio_stats(filepath, waveform_cache)[0]
+
+    def plot_and_stats(filepath, framerate, gain_db=0.0):
+        return _track_preview(filepath, framerate, gain_db, track_base[filepath], lambda: get_audio(filepath))
+
+    # filepath -> (peak mins, peak maxs, max_amp, avg_amp, lufs, duration) at 0 dB, so gain
+    # changes only rescale instead of re-reducing the whole signal
+    track_base = {}
+    # filepath -> pending threading.Timer for that track's debounced gain change
+    gain_timers = {}
+    # per-track state for tracks with audio, as parallel lists in queue order
+    track_framerates, track_exts, track_filepaths = [], [], []
+    track_sliders, track_gain_vals = [], []
+    # (label, warning, img) preview controls, updated in place on gain changes
+    track_previews = []
+    # dialog rows in queue order, including placeholders for files without a waveform
+    track_rows = []
     global_gain = {'value': getattr(page, '_global_gain', 0.0)}
 
-    # Actually process stats_results to build per_track and n_images
-    for stat in stats_results:
-        audio, max_amp, avg_amp, lufs, ext, filepath = stat
-        if audio is not None:
-            if ext == '.wav':
-                with contextlib.closing(wave.open(filepath, 'rb')) as wf:
-                    framerate = wf.getframerate()
-            else:
-                framerate = 44100
+    # Peaks, LUFS and PNG renders are independent per file; numpy, PIL and the loudness
+    # filters release the GIL, so render them on a pool and build the controls afterwards
+    framerates = {}
+    for filepath, (mins, maxs, max_amp, avg_amp, lufs, framerate, n_samples) in summaries.items():
+        framerates[filepath] = framerate
+        track_base[filepath] = (mins, maxs, max_amp, avg_amp, lufs, n_samples / framerate)
+    for filepath, stat in decoded.items():
+        if stat[4] == '.wav':
+            framerates[filepath] = _wav_meta(filepath)[0]
+        else:
+            framerates[filepath] = 44100
+
+    def render_initial(filepath):
+        framerate = framerates[filepath]
+        base = track_base.get(filepath)
+        if base is None:
+            audio, max_amp, avg_amp, lufs, _, _ = decoded[filepath]
+            base = _track_base(audio, framerate, max_amp, avg_amp, lufs)
+            save_waveform_summary(filepath, n_cols, *base[:5], framerate, len(audio))
+        gain_db = page._track_gains.get(filepath, 0.0)
+        return base, _track_preview(filepath, framerate, gain_db, base, lambda: get_audio(filepath))
+
+    previews = {}
+    to_render = list(framerates)
+    if to_render:
+        with ThreadPoolExecutor() as executor:
+            future_to_path = {executor.submit(render_initial, filepath): filepath for filepath in to_render}
+            for completed, future in enumerate(as_completed(future_to_path), 1):
+                filepath = future_to_path[future]
+                track_base[filepath], previews[filepath] = future.result()
+                set_progress(completed, len(to_render), f"Rendering waveforms... {completed}/{len(to_render)}")
+
+    def refresh_track(i, gain_db):
+        """Redraw track `i`'s preview at `gain_db` and record the gain for upload."""
+        filepath = track_filepaths[i]
+        show_preview(plot_and_stats(filepath, track_framerates[i], gain_db=gain_db), *track_previews[i])
+        # Encoding the adjusted file is left to Save or to upload time
+        # (save_pending_gain_adjustments); a gain change only records it
+        if abs(gain_db) > 0.01:
+            gain_adjusted_files[filepath] = {'gain': gain_db, 'temp_path': None, 'dirty': True}
+        else:
+            gain_adjusted_files.pop(filepath, None)
+
+    # Build the per-track lists and dialog rows in queue order
+    for filepath in files:
+        if filepath in previews:
+            ext = os.path.splitext(filepath)[1].lower()
+            framerate = framerates[filepath]
             # Use last gain value for this file if available
             last_gain = page._track_gains.get(filepath, 0.0)
             gain_slider = ft.Slider(min=-20, max=20, divisions=40, value=last_gain, label="Gain: {value} dB", width=320)
-            label, warning, tmp_path = plot_and_stats(audio, framerate, ext, filepath, gain_db=last_gain)
-            img = ft.Image(src=tmp_path, width=320, height=100)
+            label = ft.Text(size=10, color=ft.Colors.BLUE)
+            warning = ft.Text(size=10, visible=False)
+            img = ft.Image(width=320, height=100)
+            show_preview(previews[filepath], label, warning, img)
             col = ft.Column([])
             gain_val = {'value': last_gain}
-            def on_gain_change(e, audio=audio, framerate=framerate, ext=ext, filepath=filepath, col=col, gain_val=gain_val):
+            def apply_gain(gain_db, i=len(track_filepaths)):
+                refresh_track(i, gain_db)
+                page.update()
+            def on_gain_change(e, filepath=filepath, gain_val=gain_val, apply_gain=apply_gain):
                 gain_db = e.control.value
                 gain_val['value'] = gain_db
                 page._track_gains[filepath] = gain_db
-                label, warning, tmp_path = plot_and_stats(audio, framerate, ext, filepath, gain_db=gain_db)
-                col.controls.clear()
-                col.controls.append(label)
-                if warning:
-                    col.controls.append(warning)
-                col.controls.append(ft.Image(src=tmp_path, width=320, height=100))
-                # Show progress dialog only if saving gain-adjusted file (not for zero gain)
-                show_progress = abs(gain_db) > 0.01
-                progress_dlg = None
-                if show_progress:
-                    progress_dlg = ft.AlertDialog(title=ft.Text("Saving gain-adjusted audio..."), content=ft.ProgressBar(width=300), modal=True)
-                    page.open(progress_dlg)
-                    page.update()
-                try:
-                    if abs(gain_db) > 0.01:
-                        if audio_adjust_utils is not None:
-                            try:
-                                temp_path = getattr(audio_adjust_utils, "save_adjusted_audio")(audio * (10 ** (gain_db / 20.0)), framerate, ext, filepath, gain_db)
-                                gain_adjusted_files[filepath] = {'gain': gain_db, 'temp_path': temp_path}
-                            except Exception as ex:
-                                show_snack(f"Failed to save adjusted audio for upload: {ex}", error=True)
-                    else:
-                        gain_adjusted_files.pop(filepath, None)
-                finally:
-                    if progress_dlg:
-                        page.close(progress_dlg)
-                        page.update()
-                page.update()
+                # collapse a burst of slider releases into one render/save at the final gain
+                timer = gain_timers.pop(filepath, None)
+                if timer:
+                    timer.cancel()
+                timer = gain_timers[filepath] = threading.Timer(0.15, apply_gain, args=(gain_db,))
+                timer.start()
             gain_slider.on_change_end = on_gain_change
-            def on_save_adjusted_audio_click(e, audio=audio, framerate=framerate, ext=ext, filepath=filepath, gain_val=gain_val):
+            def on_save_adjusted_audio_click(e, framerate=framerate, ext=ext, filepath=filepath, gain_val=gain_val):
                 if audio_adjust_utils is None:
                     show_snack("audio_adjust_utils could not be loaded", error=True)
                     return
-                progress_dlg = ft.AlertDialog(title=ft.Text("Saving gain-adjusted audio..."), content=ft.ProgressBar(width=300), modal=True)
-                page.open(progress_dlg)
-                page.update()
+                show_progress("Saving gain-adjusted audio...", os.path.basename(filepath), value=None)
                 try:
-                    temp_path = getattr(audio_adjust_utils, "save_adjusted_audio")(audio * (10 ** (gain_val['value'] / 20.0)), framerate, ext, filepath, gain_val['value'])
+                    temp_path = getattr(audio_adjust_utils, "save_adjusted_audio")(get_audio(filepath) * (10 ** (gain_val['value'] / 20.0)), framerate, ext, filepath, gain_val['value'])
                     show_snack(f"Saved adjusted audio to: {temp_path}")
                     if abs(gain_val['value']) > 0.01:
                         logger.debug(f"Storing gain-adjusted file for {filepath} with gain {gain_val['value']} dB at {temp_path}")
@@ -192,42 +400,46 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
                 except Exception as ex:
                     show_snack(f"Failed to save adjusted audio: {ex}", error=True)
                 finally:
-                    page.close(progress_dlg)
-                    page.update()
-            save_btn = ft.TextButton("Save Adjusted Audio", on_click=on_save_adjusted_audio_click, tooltip="Save gain-adjusted audio to a temp file for upload")
-            col.controls.append(label)
-            if warning:
-                col.controls.append(warning)
-            col.controls.append(img)
-            col.controls.append(save_btn)
-            per_track.append((audio, framerate, ext, filepath, gain_slider, col, gain_val))
-            n_images += 1
+                    hide_progress()
+            save_btn = ft.TextButton("Save Adjusted Audio", on_click=on_save_adjusted_audio_click, tooltip="Write the gain-adjusted audio now instead of at upload time")
+            col.controls.extend([label, warning, img, save_btn])
+            track_framerates.append(framerate)
+            track_exts.append(ext)
+            track_filepaths.append(filepath)
+            track_sliders.append(gain_slider)
+            track_gain_vals.append(gain_val)
+            track_previews.append((label, warning, img))
+            track_rows.append(ft.Column([gain_slider, col]))
         else:
-            per_track.append((None, None, None, None, None, ft.Text("(No waveform for file)", size=10, color=ft.Colors.RED), None))
+            track_rows.append(ft.Text("(No waveform for file)", size=10, color=ft.Colors.RED))
+    n_images = len(track_filepaths)
 
     def on_global_gain_change(e):
         global_gain['value'] = e.control.value
         page._global_gain = e.control.value
-        progress_text2 = ft.Text("Applying global gain to all tracks...", size=14)
-        progress_bar2 = ft.ProgressBar(width=300, value=0)
-        progress_dlg2 = ft.AlertDialog(title=ft.Text("Applying Global Gain..."), content=ft.Column([progress_text2, progress_bar2]), modal=True)
-        page.open(progress_dlg2)
-        page.update()
-        total = len(per_track)
-        completed = 0
-        for i, (audio, framerate, ext, filepath, gain_slider, col, gain_val) in enumerate(per_track):
-            if gain_slider is not None and audio is not None:
-                gain_slider.value = global_gain['value']
-                gain_val['value'] = global_gain['value']
-                page._track_gains[filepath] = global_gain['value']
-            completed += 1
-            progress_text2.value = f"Processed {completed} of {total} tracks"
-            progress_bar2.value = completed / total
-            page.update()
-        page.close(progress_dlg2)
+        show_progress("Applying Global Gain...", "Applying global gain to all tracks...")
+        gain_db = global_gain['value']
+        # a pending per-track change would otherwise land after, and override, the global one
+        for timer in gain_timers.values():
+            timer.cancel()
+        gain_timers.clear()
+        for gain_slider, gain_val in zip(track_sliders, track_gain_vals):
+            gain_slider.value = gain_db
+            gain_val['value'] = gain_db
+        page._track_gains.update(dict.fromkeys(track_filepaths, gain_db))
+        # Redraw each track in place from its cached peaks rather than reopening the dialog
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(refresh_track, i, gain_db) for i in range(n_images)]
+            for completed, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.error(f"Failed to refresh waveform preview: {ex}")
+                set_progress(completed, n_images, f"Processed {completed} of {n_images} tracks")
+        page.close(progress_dlg)
+        # the progress dialog displaced this one; bring it back with the redrawn previews
+        page.open(dlg)
         page.update()
-        # Reopen the waveform popup after applying global gain, so waveforms are regenerated
-        show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files, audio_adjust_utils, waveform_cache)
 
     global_gain_slider = ft.Slider(min=-20, max=20, divisions=40, value=global_gain['value'], label="Global Gain: {value} dB", width=320)
     global_gain_slider.on_change_end = on_global_gain_change
@@ -239,7 +451,8 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
             "- Gain sliders change track level in decibels (dB). +6 dB ≈ doubling the amplitude; -6 dB ≈ halving.",
             "- Use the Global Gain to set a common level for all tracks, then fine-tune individual tracks.",
             "- LUFS is a loudness metric; aim for ~-16 to -14 LUFS for general use, avoid values above -9 dB (may be too loud).",
-            "- Changes shown in the waveform preview reflect the gain in the UI; use Save Adjusted Audio to write a temp file for upload.",
+            "- Changes shown in the waveform preview reflect the gain in the UI; slider gains are applied automatically when you upload.",
+            "- Save Adjusted Audio is only needed if you want the gain-adjusted file written right away instead of at upload time.",
             "- Small adjustments (±1–3 dB) are common for balancing; larger changes may clip if the original is already hot.",
             "- If you need to normalize loudness precisely, consider using LUFS-based normalisation tools outside this dialog.",
         ]
@@ -253,37 +466,39 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
             if audio_adjust_utils is None:
                 show_snack("audio_adjust_utils could not be loaded", error=True)
                 return
-            progress_text3 = ft.Text("Saving gain-adjusted audio for all tracks...", size=14)
-            progress_bar3 = ft.ProgressBar(width=300, value=0)
-            progress_dlg3 = ft.AlertDialog(title=ft.Text("Saving gain-adjusted audio..."), content=ft.Column([progress_text3, progress_bar3]), modal=True)
-            page.open(progress_dlg3)
-            page.update()
+            show_progress("Saving gain-adjusted audio...", "Saving gain-adjusted audio for all tracks...")
             total = n_images
-            completed = 0
             errors = []
-            for audio, framerate, ext, filepath, gain_slider, col, gain_val in per_track:
-                try:
-                    temp_path = getattr(audio_adjust_utils, "save_adjusted_audio")(audio * (10 ** (gain_val['value'] / 20.0)), framerate, ext, filepath, gain_val['value'])
-                    if abs(gain_val['value']) > 0.01:
-                        gain_adjusted_files[filepath] = {'gain': gain_val['value'], 'temp_path': temp_path}
-                        # Update the upload queue row to use the new temp_path
-                        for row in getattr(file_rows_column, 'controls', []):
-                            fileuploadrow = getattr(row, '_fileuploadrow', None)
-                            if fileuploadrow and fileuploadrow.filepath == filepath:
-                                fileuploadrow.update_file(temp_path)
-                                setattr(row, 'filename', temp_path)
-                                break
-                    else:
-                        gain_adjusted_files.pop(filepath, None)
-                    progress_text3.value = f"Saved: {os.path.basename(filepath)}"
-                except Exception as ex:
-                    errors.append(f"{os.path.basename(filepath)}: {ex}")
-                    progress_text3.value = f"Error: {os.path.basename(filepath)}"
-                completed += 1
-                progress_bar3.value = completed / total
-                page.update()
-            page.close(progress_dlg3)
-            page.update()
+
+            def save_one(framerate, ext, filepath, gain_db):
+                return getattr(audio_adjust_utils, "save_adjusted_audio")(get_audio(filepath) * (10 ** (gain_db / 20.0)), framerate, ext, filepath, gain_db)
+
+            # Encodes (pydub/ffmpeg for MP3) run on a small pool; bookkeeping and UI stay here.
+            # Capped so only a few gained copies of the audio are alive at once.
+            jobs = [(framerate, ext, filepath, gain_val['value']) for framerate, ext, filepath, gain_val in zip(track_framerates, track_exts, track_filepaths, track_gain_vals)]
+            with ThreadPoolExecutor(max_workers=min(4, total)) as executor:
+                future_to_job = {executor.submit(save_one, *job): job for job in jobs}
+                for completed, future in enumerate(as_completed(future_to_job), 1):
+                    _, _, filepath, gain_db = future_to_job[future]
+                    try:
+                        temp_path = future.result()
+                        if abs(gain_db) > 0.01:
+                            gain_adjusted_files[filepath] = {'gain': gain_db, 'temp_path': temp_path}
+                            # Update the upload queue row to use the new temp_path
+                            for row in getattr(file_rows_column, 'controls', []):
+                                fileuploadrow = getattr(row, '_fileuploadrow', None)
+                                if fileuploadrow and fileuploadrow.filepath == filepath:
+                                    fileuploadrow.update_file(temp_path)
+                                    setattr(row, 'filename', temp_path)
+                                    break
+                        else:
+                            gain_adjusted_files.pop(filepath, None)
+                        msg = f"Saved: {os.path.basename(filepath)}"
+                    except Exception as ex:
+                        errors.append(f"{os.path.basename(filepath)}: {ex}")
+                        msg = f"Error: {os.path.basename(filepath)}"
+                    set_progress(completed, total, msg)
+            hide_progress()
             if errors:
                 show_snack(f"Some files failed: {'; '.join(errors)}", error=True)
             else:
@@ -302,14 +517,7 @@ def show_waveforms_popup(page, file_rows_column, show_snack, gain_adjusted_files
     else:
         images.append(global_gain_slider)
         images.append(ft.Text("Adjust all tracks at once with the global gain slider above. You can still fine-tune individual tracks below.", size=10, color=ft.Colors.BLUE))
-        for audio, framerate, ext, filepath, gain_slider, col, gain_val in per_track:
-            if gain_slider is not None and audio is not None:
-                images.append(ft.Column([
-                    gain_slider,
-                    col
-                ]))
-            else:
-                images.append(col)
+        images.extend(track_rows)
         images.insert(0, ft.Text(f"Generated {n_images} waveform(s) for {len(files)} file(s).", color=ft.Colors.GREEN))
         if save_btn:
             dlg_actions = [save_btn, ft.TextButton("Help", on_click=show_gain_help), ft.TextButton("Close", on_click=lambda e: page.close(dlg))]
@@ -1,19 +1,26 @@
 import os
 import json
+import functools
 from pathlib import Path
-import tempfile
 import base64
 import io
-import copy
+import re
+import struct
+import threading
 import flet as ft
+import numpy as np
 from loguru import logger
 from PIL import Image
 
-from .icon_import_helpers import get_base64_from_path
+from .pixel_grid import pixels_to_np, np_to_pixels, image_to_np, np_to_image, blit_stamp, blit_scaled, chroma_key, png_base64, resize_nearest
 from yoto_up.paths import STAMPS_DIR
 import importlib.resources as pkg_resources
 import shutil
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def seed_stamps_if_empty(d):
     # If directory is empty (no .png/.json), seed some basic stamps for users
@@ -107,6 +114,121 @@ STAMP_GALLERY_DIALOG = None
 # Use the centralized stamps dir from paths.py (absolute path)
 stamps_dir = str(STAMPS_DIR)
 
+def _make_thumbnail(img, size):
+    """Return a size x size RGBA thumbnail of `img`.
+
+    Square stamps whose side divides `size` are expanded by whole-cell
+    repetition; anything else goes through a LANCZOS resize.
+    """
+    img = img.convert('RGBA')
+    w, h = img.size
+    if w == h and 0 < w <= size and size % w == 0:
+        f = size // w
+        a = np.asarray(img, dtype=np.uint8)
+        if f > 1:
+            a = np.repeat(np.repeat(a, f, axis=0), f, axis=1)
+        return Image.fromarray(a, 'RGBA')
+    try:
+        resample = Image.Resampling.LANCZOS
+    except Exception:
+        resample = Image.BICUBIC if hasattr(Image, 'BICUBIC') else Image.NEAREST
+    return img.resize((size, size), resample)
+
+
+@functools.lru_cache(maxsize=8)
+def _checkerboard(w, h, sq):
+    """Return a w x h RGBA checkerboard of sq-pixel squares used behind transparent previews.
+
+    Cached per size since the editor grid rarely changes; callers must not mutate the result.
+    """
+    ys, xs = np.indices((h, w))
+    odd = (((xs // sq) + (ys // sq)) & 1).astype(bool)
+    arr = np.where(odd[..., None], np.array([240, 240, 240, 255], dtype=np.uint8), np.array([200, 200, 200, 255], dtype=np.uint8))
+    return Image.fromarray(arr.astype(np.uint8), 'RGBA')
+
+
+# (abspath, mtime, scale) -> (w, h) of the stamp grid produced at that scale
+_STAMP_SIZE_CACHE = {}
+
+# 3x3 placement grid labels, row by row; each dialog builds its own buttons from these
+_POSITION_ROWS = (
+    ("Top Left", "Top Center", "Top Right"),
+    ("Middle Left", "Center", "Middle Right"),
+    ("Bottom Left", "Bottom Center", "Bottom Right"),
+)
+
+
+# first 24 bytes (32 base64 chars) of an embedded PNG: signature + IHDR length/type + width/height
+_PNG_B64_HEAD_RE = re.compile(rb'"png_base64"\s*:\s*"([A-Za-z0-9+/]{32})')
+
+
+def _load_stamp_json(path):
+    """Parse a stamp JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as fh:
+        data = fh.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _png_b64_header_size(data):
+    """Read (w, h) of an embedded png_base64 stamp from its IHDR without decoding the blob."""
+    m = _PNG_B64_HEAD_RE.search(data)
+    if not m:
+        return None
+    head = base64.b64decode(m.group(1))
+    if head[:8] != b'\x89PNG\r\n\x1a\n' or head[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', head[16:24])
+
+
+def _scaled_size(w, h, scale_f):
+    if abs(scale_f - 1.0) > 1e-6:
+        return max(1, int(round(w * scale_f))), max(1, int(round(h * scale_f)))
+    return w, h
+
+
+def get_stamp_size(path, scale_f):
+    """Return the (w, h) a stamp file occupies at `scale_f` without decoding its pixels.
+
+    PNG sizes come from the image header only, embedded PNGs from the IHDR at the
+    start of their base64 string and pixel JSON from the row lengths. Results are
+    cached per file mtime.
+    """
+    try:
+        p = os.path.abspath(path)
+        key = (p, os.path.getmtime(p), float(scale_f))
+    except Exception:
+        return 0, 0
+    cached = _STAMP_SIZE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    w = h = 0
+    try:
+        if p.lower().endswith('.png'):
+            with Image.open(p) as im:
+                w, h = im.size
+        else:
+            with open(p, 'rb') as fh:
+                data = fh.read()
+            wh = _png_b64_header_size(data)
+            if wh:
+                w, h = wh
+            else:
+                obj = orjson.loads(data) if orjson is not None else json.loads(data)
+                if isinstance(obj, dict) and obj.get('png_base64'):
+                    with Image.open(io.BytesIO(base64.b64decode(obj['png_base64']))) as im:
+                        w, h = im.size
+                elif isinstance(obj, dict) and isinstance(obj.get('pixels'), list):
+                    h = len(obj['pixels'])
+                    w = max((len(r) for r in obj['pixels']), default=0)
+    except Exception:
+        logger.exception(f"Error probing stamp size for {p}")
+        return 0, 0
+    size = _scaled_size(w, h, float(scale_f)) if w and h else (0, 0)
+    _STAMP_SIZE_CACHE[key] = size
+    return size
+
 
 def open_image_stamp_dialog(editor, e):
     """Open the stamp image dialog using the provided editor instance.
@@ -126,29 +248,29 @@ def open_image_stamp_dialog(editor, e):
     seed_stamps_if_empty(provided_dir)
 
 
-    # gather file list (include .stamps/imported)
+    # gather file list (include .stamps/imported); `listed` mirrors `files` for O(1) dedupe
+    listed = set()
+
+    def add_stamp_files(d):
+        for fn in os.listdir(d):
+            if fn.lower().endswith(('.png', '.json')):
+                abs_path = os.path.join(d, fn)
+                if abs_path not in listed:
+                    listed.add(abs_path)
+                    files.append(abs_path)
+
     try:
         if stamps_dir and os.path.isdir(stamps_dir):
-            for fn in os.listdir(stamps_dir):
-                if fn.lower().endswith('.png') or fn.lower().endswith('.json'):
-                    files.append(os.path.join(stamps_dir, fn))
+            add_stamp_files(stamps_dir)
             # include imported subfolder contents (if present)
             try:
                 imported_dir = os.path.join(stamps_dir, 'imported')
                 if os.path.isdir(imported_dir):
-                    for fn in os.listdir(imported_dir):
-                        if fn.lower().endswith('.png') or fn.lower().endswith('.json'):
-                            abs_path = os.path.join(imported_dir, fn)
-                            if abs_path not in files:
-                                files.append(abs_path)
+                    add_stamp_files(imported_dir)
             except Exception:
                 pass
             try:
-                for fn in os.listdir(provided_dir):
-                    if fn.lower().endswith('.png') or fn.lower().endswith('.json'):
-                        abs_path = os.path.join(provided_dir, fn)
-                        if abs_path not in files:
-                            files.append(abs_path)
+                add_stamp_files(provided_dir)
             except Exception:
                 pass
 
@@ -157,11 +279,7 @@ def open_image_stamp_dialog(editor, e):
     try:
         if saved_dir:
             sd = str(saved_dir) if hasattr(saved_dir, 'as_posix') else saved_dir
-            for fn in os.listdir(sd):
-                if fn.lower().endswith('.png') or fn.lower().endswith('.json'):
-                    abs_path = os.path.join(sd, fn)
-                    if abs_path not in files:
-                        files.append(abs_path)
+            add_stamp_files(sd)
     except Exception:
         logger.exception("Error listing saved icons for stamp dialog")
 
@@ -238,7 +356,8 @@ def open_image_stamp_dialog(editor, e):
             except Exception:
                 pass
             try:
-                on_select(None)
+                update_stamp_size()
+                schedule_preview(0)
             except Exception:
                 pass
         except Exception:
@@ -254,7 +373,6 @@ def open_image_stamp_dialog(editor, e):
             stamp_grid.controls.clear()
         except Exception:
             pass
-        import tempfile as _temp
         per_row = 6
         row = []
         for f in files:
@@ -296,14 +414,13 @@ def open_image_stamp_dialog(editor, e):
                 thumb_img = None
                 try:
                     if p.lower().endswith('.json'):
-                        with open(p, 'r', encoding='utf-8') as _fh:
-                            _obj = json.load(_fh)
+                        _obj = _load_stamp_json(p)
                         if isinstance(_obj, dict) and _obj.get('png_base64'):
                             b = base64.b64decode(_obj['png_base64'])
                             thumb_img = Image.open(io.BytesIO(b)).convert('RGBA')
                         elif isinstance(_obj, dict) and 'pixels' in _obj and isinstance(_obj['pixels'], list):
                             try:
-                                thumb_img = editor._pixels_to_image(_obj['pixels']).convert('RGBA')
+                                thumb_img = np_to_image(pixels_to_np(_obj['pixels'], editor._hex_to_rgba))
                             except Exception:
                                 thumb_img = None
                         else:
@@ -316,15 +433,8 @@ def open_image_stamp_dialog(editor, e):
                 if thumb_img is None:
                     continue
 
-                try:
-                    resample = Image.Resampling.LANCZOS
-                except Exception:
-                    resample = Image.BICUBIC if hasattr(Image, 'BICUBIC') else Image.NEAREST
-                thumb = thumb_img.resize((48, 48), resample)
-                tmpf = _temp.NamedTemporaryFile(suffix='.png', delete=False)
-                thumb.save(tmpf.name)
-
-                img_widget = ft.Image(src_base64=get_base64_from_path(Path(tmpf.name)), width=48, height=48, fit=ft.ImageFit.CONTAIN)
+                thumb = _make_thumbnail(thumb_img, 48)
+                img_widget = ft.Image(src_base64=png_base64(thumb), width=48, height=48, fit=ft.ImageFit.CONTAIN)
                 try:
                     img_ctrl = ft.Container(content=img_widget, width=48, height=48, on_click=lambda ev, lbl=label: select_stamp(lbl, ev))
                 except Exception:
@@ -475,7 +585,7 @@ def open_image_stamp_dialog(editor, e):
             chroma_color_field.value = hex_color
             chroma_color_field.update()
             try:
-                on_select(None)
+                schedule_preview(0)
             except Exception:
                 pass
         try:
@@ -488,19 +598,9 @@ def open_image_stamp_dialog(editor, e):
             pass
 
     chroma_picker_btn = ft.TextButton("Pick", on_click=open_chroma_picker)
-    chroma_checkbox.on_change = lambda ev: on_select(None)
-    chroma_color_field.on_change = lambda ev: on_select(None)
-
-    positions = [
-        "Top Left", "Top Center", "Top Right",
-        "Middle Left", "Center", "Middle Right",
-        "Bottom Left", "Bottom Center", "Bottom Right"
-    ]
+    chroma_checkbox.on_change = lambda ev: schedule_preview(0)
+    chroma_color_field.on_change = lambda ev: schedule_preview()
 
-    def get_stamp_size_from_pixels(pixels):
-        h = len(pixels)
-        w = max((len(r) for r in pixels), default=0)
-        return w, h
 
     def resolve_mapped_path(mapped_in):
         """Resolve a mapped value from the dropdown to an absolute path.
@@ -529,11 +629,14 @@ def open_image_stamp_dialog(editor, e):
             return mapped_in
 
 
-    def set_position(pos):
-        grid_size = editor.size
+    current_stamp_wh = (0, 0)
+
+    def update_stamp_size():
+        # re-probe only when the selected file or scale changes so position clicks stay cheap
+        nonlocal current_stamp_wh
         v = dropdown.value
         mapped = option_map.get(v, v) if v else None
-        stamp_w = stamp_h = 0
+        current_stamp_wh = (0, 0)
         try:
             if mapped:
                 p = resolve_mapped_path(mapped)
@@ -542,23 +645,13 @@ def open_image_stamp_dialog(editor, e):
                         sf = float(scale_dropdown.value)
                     except Exception:
                         sf = 1.0
-                    pixels_for_size = load_pixels_for_stamp(p, sf)
-                    if pixels_for_size:
-                        w, h = get_stamp_size_from_pixels(pixels_for_size)
-                        stamp_w, stamp_h = w, h
-                    else:
-                        if p.lower().endswith('.png'):
-                            img = Image.open(p).convert('RGBA')
-                            w, h = img.size
-                            stamp_w, stamp_h = int(round(w * sf)), int(round(h * sf))
-                        else:
-                            with open(p, 'r', encoding='utf-8') as fh:
-                                obj = json.load(fh)
-                            if isinstance(obj, dict) and 'pixels' in obj:
-                                w, h = get_stamp_size_from_pixels(obj['pixels'])
-                                stamp_w, stamp_h = int(round(w * sf)), int(round(h * sf))
+                    current_stamp_wh = get_stamp_size(p, sf)
         except Exception:
-            stamp_w, stamp_h = 0, 0
+            current_stamp_wh = (0, 0)
+
+    def set_position(pos):
+        grid_size = editor.size
+        stamp_w, stamp_h = current_stamp_wh if dropdown.value else (0, 0)
 
         if pos == "Top Left":
             x = 0
@@ -595,116 +688,93 @@ def open_image_stamp_dialog(editor, e):
         pos_x.update()
         pos_y.update()
         try:
-            on_select(None)
+            schedule_preview(0)
         except Exception:
             pass
 
-    grid_rows = []
-    for r in range(3):
-        row_buttons = []
-        for c in range(3):
-            idx = r * 3 + c
-            label = positions[idx]
-            row_buttons.append(ft.TextButton(label, on_click=lambda ev, label=label: set_position(label)))
-        grid_rows.append(ft.Row(row_buttons, spacing=4))
-    pos_buttons = ft.Column(grid_rows, spacing=4)
-
-    def scale_pixel_grid(pixels, factor):
-        if factor == 1:
-            return pixels
-        h = len(pixels)
-        w = max((len(r) for r in pixels), default=0)
-        nh = h * factor
-        nw = w * factor
-        out = [[None for _ in range(nw)] for _ in range(nh)]
-        for y in range(h):
-            for x in range(len(pixels[y])):
-                v = pixels[y][x]
-                if v is None:
-                    continue
-                for dy in range(factor):
-                    for dx in range(factor):
-                        out[y*factor + dy][x*factor + dx] = v
-        return out
+    # controls can't be shared between dialogs, so only the label layout is cached
+    pos_buttons = ft.Column([
+        ft.Row([
+            ft.TextButton(label, on_click=lambda ev, label=label: set_position(label))
+            for label in labels
+        ], spacing=4)
+        for labels in _POSITION_ROWS
+    ], spacing=4)
+
+    # editor.size is fixed while the dialog is open; keep one scratch canvas for building stamps
+    stamp_scratch = getattr(editor, '_stamp_scratch', None)
+    if stamp_scratch is None or stamp_scratch.shape != (editor.size, editor.size):
+        stamp_scratch = np.zeros((editor.size, editor.size), dtype=np.uint32)
+        editor._stamp_scratch = stamp_scratch
+
+    def scale_pixel_grid(arr, factor):
+        """Scale a packed stamp array; integer factors repeat cells, others use a NEAREST resize."""
+        if abs(factor - 1.0) <= 1e-6 or arr.size == 0:
+            return arr
+        if abs(factor - round(factor)) <= 1e-6:
+            f = int(round(factor))
+            return np.repeat(np.repeat(arr, f, axis=0), f, axis=1)
+        h, w = arr.shape
+        nw = max(1, int(round(w * factor)))
+        nh = max(1, int(round(h * factor)))
+        return resize_nearest(arr, (nw, nh))
+
+    def load_stamp_source(path):
+        """Load a stamp file as an unscaled packed ARGB uint32 array."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            if path.lower().endswith('.png'):
+                return image_to_np(Image.open(path))
+            obj = _load_stamp_json(path)
+            if isinstance(obj, dict) and obj.get('png_base64'):
+                b = base64.b64decode(obj['png_base64'])
+                return image_to_np(Image.open(io.BytesIO(b)))
+            if isinstance(obj, dict) and 'pixels' in obj and isinstance(obj['pixels'], list):
+                return pixels_to_np(obj['pixels'], editor._hex_to_rgba)
+        except Exception:
+            pass
+        return None
+
+    def chroma_rgb():
+        """Return the chroma-key RGB when keying is enabled and the colour parses, else None."""
+        if not chroma_checkbox.value:
+            return None
+        try:
+            tr, tg, tb, _ = editor._hex_to_rgba(chroma_color_field.value)
+            return (tr, tg, tb)
+        except Exception:
+            return None
 
     def load_pixels_for_stamp(path, scale):
-        if not path or not os.path.exists(path):
+        """Load a stamp file as a packed ARGB uint32 array, scaled and with chroma applied."""
+        arr = load_stamp_source(path)
+        if arr is None:
             return None
         try:
             try:
                 scale_f = float(scale)
             except Exception:
                 scale_f = 1.0
-            if path.lower().endswith('.png'):
-                img = Image.open(path).convert('RGBA')
-                try:
-                    resample = Image.Resampling.NEAREST
-                except Exception:
-                    resample = Image.NEAREST if hasattr(Image, 'NEAREST') else 0
-                if abs(scale_f - 1.0) > 1e-6:
-                    nw = max(1, int(round(img.width * scale_f)))
-                    nh = max(1, int(round(img.height * scale_f)))
-                    img = img.resize((nw, nh), resample)
-                pixels = editor._image_to_pixels_native(img)
-            else:
-                with open(path, 'r', encoding='utf-8') as fh:
-                    obj = json.load(fh)
-                if isinstance(obj, dict) and obj.get('png_base64'):
-                    b = base64.b64decode(obj['png_base64'])
-                    img = Image.open(io.BytesIO(b)).convert('RGBA')
-                    try:
-                        resample = Image.Resampling.NEAREST
-                    except Exception:
-                        resample = Image.NEAREST if hasattr(Image, 'NEAREST') else 0
-                    if abs(scale_f - 1.0) > 1e-6:
-                        nw = max(1, int(round(img.width * scale_f)))
-                        nh = max(1, int(round(img.height * scale_f)))
-                        img = img.resize((nw, nh), resample)
-                    pixels = editor._image_to_pixels_native(img)
-                elif isinstance(obj, dict) and 'pixels' in obj and isinstance(obj['pixels'], list):
-                    pixels = obj['pixels']
-                    if abs(scale_f - 1.0) > 1e-6:
-                        try:
-                            img = editor._pixels_to_image(pixels)
-                            try:
-                                resample = Image.Resampling.NEAREST
-                            except Exception:
-                                resample = Image.NEAREST if hasattr(Image, 'NEAREST') else 0
-                            nw = max(1, int(round(img.width * scale_f)))
-                            nh = max(1, int(round(img.height * scale_f)))
-                            img = img.resize((nw, nh), resample)
-                            pixels = editor._image_to_pixels_native(img)
-                        except Exception:
-                            try:
-                                if int(scale_f) > 1:
-                                    pixels = scale_pixel_grid(pixels, int(scale_f))
-                            except Exception:
-                                pass
-            if chroma_checkbox.value:
-                try:
-                    tr, tg, tb, _ = editor._hex_to_rgba(chroma_color_field.value)
-                    for yy in range(len(pixels)):
-                        for xx in range(len(pixels[yy])):
-                            px = pixels[yy][xx]
-                            if px is None:
-                                continue
-                            pr, pg, pb, _ = editor._hex_to_rgba(px)
-                            if pr == tr and pg == tg and pb == tb:
-                                pixels[yy][xx] = None
-                except Exception:
-                    pass
-            try:
-                if not path.lower().endswith('.png'):
-                    sf_int = int(round(float(scale)))
-                    if sf_int > 1 and abs(float(scale) - sf_int) < 1e-6:
-                        pixels = scale_pixel_grid(pixels, sf_int)
-            except Exception:
-                pass
-            return pixels
+            arr = scale_pixel_grid(arr, scale_f)
+            key = chroma_rgb()
+            if key is not None:
+                chroma_key(arr, key)
+            return arr
         except Exception:
             return None
 
+    # inputs of the last preview that rendered successfully; guarded by preview_lock
+    last_preview_key = None
+    preview_lock = threading.Lock()
+
     def on_select(ev):
+        # posted rebuilds may land on different pool threads; render one at a time
+        with preview_lock:
+            render_preview()
+
+    def render_preview():
+        nonlocal last_preview_key
         v = dropdown.value
         if not v:
             return
@@ -718,6 +788,15 @@ def open_image_stamp_dialog(editor, e):
         except Exception:
             p = mapped
 
+        # focus/blur and repeated change events often carry identical inputs; skip the rebuild then
+        try:
+            mtime = os.path.getmtime(p) if p else None
+        except Exception:
+            mtime = None
+        preview_key = (p, mtime, scale_dropdown.value, pos_x.value, pos_y.value, chroma_checkbox.value, chroma_color_field.value, opaque_only.value)
+        if preview_key == last_preview_key:
+            return
+
         logger.debug(f"Stamp dialog on_select: selected value={v} mapped={mapped} resolved_path={p} exists={os.path.exists(p) if p else 'N/A'} scale={scale_dropdown.value}")
 
         try:
@@ -725,229 +804,53 @@ def open_image_stamp_dialog(editor, e):
         except Exception:
             scale = 1.0
 
-        def apply_chroma(pixels):
-            if not chroma_checkbox.value:
-                return pixels
-            try:
-                tr, tg, tb, _ = editor._hex_to_rgba(chroma_color_field.value)
-            except Exception:
-                return pixels
-            h = len(pixels)
-            for yy in range(h):
-                row = pixels[yy]
-                for xx in range(len(row)):
-                    px = row[xx]
-                    if px is None:
-                        continue
-                    try:
-                        pr, pg, pb, _ = editor._hex_to_rgba(px)
-                        if pr == tr and pg == tg and pb == tb:
-                            row[xx] = None
-                    except Exception:
-                        continue
-            return pixels
-
         try:
-            pixels_scaled = load_pixels_for_stamp(p, scale)
-            if pixels_scaled is not None:
-                base64_out = editor._pixels_to_base64(pixels_scaled)
-                #img_out = editor._pixels_to_image(pixels_scaled)
-                #with _tmp.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                #    img_out.save(tmp.name)
-                #    preview.src = tmp.name
-                #    preview.update()
-                preview.src_base64 = base64_out
+            stamp = load_pixels_for_stamp(p, scale)
+            if stamp is not None:
+                preview.src_base64 = png_base64(np_to_image(stamp))
                 preview.update()
+                # only remember inputs that actually rendered, so a failed load is retried
+                last_preview_key = preview_key
                 try:
-                    applied_pixels = copy.deepcopy(editor.pixels)
+                    applied = pixels_to_np(editor.pixels, editor._hex_to_rgba)
                     ox = int((pos_x.value or '0').strip())
                     oy = int((pos_y.value or '0').strip())
-                    for y in range(len(pixels_scaled)):
-                        for x in range(len(pixels_scaled[0])):
-                            vpx = pixels_scaled[y][x]
-                            tx = x + ox
-                            ty = y + oy
-                            if 0 <= tx < editor.size and 0 <= ty < editor.size:
-                                if vpx is not None:
-                                    applied_pixels[ty][tx] = vpx
-                    try:
-                        total_ap = sum(len(row) for row in applied_pixels)
-                        trans_ap = sum(1 for r in applied_pixels for c in r if c is None)
-                        logger.debug(f"applied_preview: after stamping opaque_only={opaque_only.value} ox={ox} oy={oy} applied_transparent={trans_ap}/{total_ap}")
-                    except Exception:
-                        pass
-                    img2 = editor._pixels_to_image(applied_pixels)
-                    try:
-                        w2, h2 = img2.size
-                        sq = max(1, min(w2, h2) // 4)
-                        bg = Image.new('RGBA', img2.size, (255, 255, 255, 255))
-                        for yy in range(0, h2, sq):
-                            for xx in range(0, w2, sq):
-                                c = (200, 200, 200, 255) if ((xx//sq)+(yy//sq)) % 2 == 0 else (240, 240, 240, 255)
-                                for y2 in range(yy, min(h2, yy+sq)):
-                                    for x2 in range(xx, min(w2, xx+sq)):
-                                        bg.putpixel((x2, y2), c)
-                        composed = Image.alpha_composite(bg, img2.convert('RGBA'))
-                    except Exception:
+                    blit_stamp(applied, stamp, ox, oy)
+                    alpha = applied >> 24
+                    trans_ap = int((alpha == 0).sum())
+                    logger.debug(f"applied_preview: after stamping opaque_only={opaque_only.value} ox={ox} oy={oy} applied_transparent={trans_ap}/{applied.size}")
+                    img2 = np_to_image(applied)
+                    if trans_ap == 0 and bool((alpha == 0xFF).all()):
+                        # fully opaque: the checkerboard would be hidden anyway
                         composed = img2
-                    preview_applied.src_base64 = editor._image_to_base64(composed)
-                    preview_applied.update()
-                except Exception:
-                    preview_applied.src = None
-                    preview_applied.update()
-                return
-
-            if p and os.path.exists(p) and p.lower().endswith('.json'):
-                with open(p, 'r', encoding='utf-8') as fh:
-                    obj = json.load(fh)
-                if isinstance(obj, dict) and obj.get('png_base64'):
-                    b = base64.b64decode(obj['png_base64'])
-                    try:
-                        img = Image.open(io.BytesIO(b)).convert('RGBA')
-                    except Exception:
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmpf:
-                            tmpf.write(b)
-                            preview.src = tmpf.name
-                            preview.update()
-                            preview_applied.src = tmpf.name
-                            preview_applied.update()
-                            return
-                    try:
-                        resample = Image.Resampling.NEAREST
-                    except Exception:
-                        resample = Image.NEAREST if hasattr(Image, 'NEAREST') else 0
-                    if abs(scale - 1.0) > 1e-6:
-                        nw = max(1, int(round(img.width * scale)))
-                        nh = max(1, int(round(img.height * scale)))
-                        img = img.resize((nw, nh), resample)
-                    pixels = editor._image_to_pixels_native(img)
-                    pixels = apply_chroma(pixels)
-                    img_out = editor._pixels_to_image(pixels)
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                        img_out.save(tmp.name)
-                        preview.src = tmp.name
-                        preview.update()
-                        try:
-                            applied_pixels = copy.deepcopy(editor.pixels)
-                            ox = int((pos_x.value or '0').strip())
-                            oy = int((pos_y.value or '0').strip())
-                            for y in range(len(pixels)):
-                                for x in range(len(pixels[0])):
-                                    vpx = pixels[y][x]
-                                    tx = x + ox
-                                    ty = y + oy
-                                    if 0 <= tx < editor.size and 0 <= ty < editor.size:
-                                        if vpx is not None:
-                                            applied_pixels[ty][tx] = vpx
-                            try:
-                                total_ap = sum(len(row) for row in applied_pixels)
-                                trans_ap = sum(1 for r in applied_pixels for c in r if c is None)
-                                logger.debug(f"applied_preview(embedded png): opaque_only={opaque_only.value} ox={ox} oy={oy} applied_transparent={trans_ap}/{total_ap}")
-                            except Exception:
-                                pass
-                            img2 = editor._pixels_to_image(applied_pixels)
-                            try:
-                                w2, h2 = img2.size
-                                sq = max(1, min(w2, h2) // 4)
-                                bg = Image.new('RGBA', img2.size, (255, 255, 255, 255))
-                                for yy in range(0, h2, sq):
-                                    for xx in range(0, w2, sq):
-                                        c = (200, 200, 200, 255) if ((xx//sq)+(yy//sq)) % 2 == 0 else (240, 240, 240, 255)
-                                        for y2 in range(yy, min(h2, yy+sq)):
-                                            for x2 in range(xx, min(w2, xx+sq)):
-                                                bg.putpixel((x2, y2), c)
-                                composed = Image.alpha_composite(bg, img2.convert('RGBA'))
-                            except Exception:
-                                composed = img2
-                            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp2:
-                                composed.save(tmp2.name)
-                                preview_applied.src = tmp2.name
-                                preview_applied.update()
-                        except Exception:
-                            preview_applied.src = None
-                            preview_applied.update()
-                        return
-
-                if isinstance(obj, dict) and 'pixels' in obj and isinstance(obj['pixels'], list):
-                    pixels = obj['pixels']
-                    pixels = apply_chroma(pixels)
-                    # support fractional scaling by converting to an image and resizing
-                    try:
-                        sf = float(scale)
-                    except Exception:
-                        sf = 1.0
-                    if abs(sf - round(sf)) < 1e-6:
-                        sf_int = int(round(sf))
-                        pixels_scaled = scale_pixel_grid(pixels, sf_int) if sf_int > 1 else pixels
                     else:
-                        try:
-                            img_tmp = editor._pixels_to_image(pixels)
-                            try:
-                                resample = Image.Resampling.NEAREST
-                            except Exception:
-                                resample = Image.NEAREST if hasattr(Image, 'NEAREST') else 0
-                            nw = max(1, int(round(img_tmp.width * sf)))
-                            nh = max(1, int(round(img_tmp.height * sf)))
-                            img_tmp = img_tmp.resize((nw, nh), resample)
-                            pixels_scaled = editor._image_to_pixels_native(img_tmp)
-                        except Exception:
-                            # fallback to integer scaling
-                            sf_int = max(1, int(round(sf)))
-                            pixels_scaled = scale_pixel_grid(pixels, sf_int)
-                    img_out = editor._pixels_to_image(pixels_scaled)
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                        img_out.save(tmp.name)
-                        preview.src = tmp.name
-                        preview.update()
-                    try:
-                        applied_pixels = copy.deepcopy(editor.pixels)
-                        ox = int((pos_x.value or '0').strip())
-                        oy = int((pos_y.value or '0').strip())
-                        for y in range(len(pixels_scaled)):
-                            for x in range(len(pixels_scaled[0])):
-                                vpx = pixels_scaled[y][x]
-                                tx = x + ox
-                                ty = y + oy
-                                if 0 <= tx < editor.size and 0 <= ty < editor.size:
-                                    if vpx is not None:
-                                        applied_pixels[ty][tx] = vpx
-                        try:
-                            total_ap = sum(len(row) for row in applied_pixels)
-                            trans_ap = sum(1 for r in applied_pixels for c in r if c is None)
-                            logger.debug(f"applied_preview(pixels json): opaque_only={opaque_only.value} ox={ox} oy={oy} applied_transparent={trans_ap}/{total_ap}")
-                        except Exception:
-                            pass
-                        img2 = editor._pixels_to_image(applied_pixels)
                         try:
                             w2, h2 = img2.size
                             sq = max(1, min(w2, h2) // 4)
-                            bg = Image.new('RGBA', img2.size, (255, 255, 255, 255))
-                            for yy in range(0, h2, sq):
-                                for xx in range(0, w2, sq):
-                                    c = (200, 200, 200, 255) if ((xx//sq)+(yy//sq)) % 2 == 0 else (240, 240, 240, 255)
-                                    for y2 in range(yy, min(h2, yy+sq)):
-                                        for x2 in range(xx, min(w2, xx+sq)):
-                                            bg.putpixel((x2, y2), c)
-                            composed = Image.alpha_composite(bg, img2.convert('RGBA'))
+                            bg = _checkerboard(w2, h2, sq)
+                            composed = Image.alpha_composite(bg, img2)
                         except Exception:
                             composed = img2
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp2:
-                            composed.save(tmp2.name)
-                            preview_applied.src = tmp2.name
-                            preview_applied.update()
-                    except Exception:
-                        preview_applied.src = None
-                        preview_applied.update()
-                    return
+                    preview_applied.src_base64 = png_base64(composed)
+                    preview_applied.update()
+                except Exception:
+                    preview_applied.src_base64 = None
+                    preview_applied.update()
+                return
 
-            preview.src = None
+            preview.src_base64 = None
             preview.update()
-            preview_applied.src = None
+            preview_applied.src_base64 = None
             preview_applied.update()
         except Exception as ex:
+            last_preview_key = None
             logger.exception(f"Error previewing selected stamp image: {ex}")
 
-    dropdown.on_change = on_select
+    def on_stamp_change(ev):
+        update_stamp_size()
+        schedule_preview(0)
+
+    dropdown.on_change = on_stamp_change
 
     def do_stamp(ev):
         fn = dropdown.value
@@ -967,28 +870,28 @@ def open_image_stamp_dialog(editor, e):
                 scale = float(scale_dropdown.value or '1')
             except Exception:
                 scale = 1.0
-            pixels = load_pixels_for_stamp(p, scale)
+            integer_scale = scale >= 1 and abs(scale - round(scale)) <= 1e-6
+            if integer_scale:
+                # chroma, scale and blit happen in one gather over the visible cells
+                pixels = load_stamp_source(p)
+            else:
+                pixels = load_pixels_for_stamp(p, scale)
 
-            if not pixels:
+            if pixels is None or pixels.size == 0:
                 status.value = "Failed to load pixels from file"
                 status.update()
                 return
 
             ox = int((pos_x.value or '0').strip())
             oy = int((pos_y.value or '0').strip())
-            stamp = [[None for _ in range(editor.size)] for _ in range(editor.size)]
-            for y in range(min(editor.size, len(pixels))):
-                for x in range(min(editor.size, len(pixels[0]))):
-                    v = pixels[y][x]
-                    tx = x + ox
-                    ty = y + oy
-                    if 0 <= tx < editor.size and 0 <= ty < editor.size:
-                        if opaque_only.value:
-                            if v is not None:
-                                stamp[ty][tx] = v
-                        else:
-                            stamp[ty][tx] = v
-            editor._stamp_pixels(stamp)
+            # transparent cells are skipped by _stamp_pixels, so opaque_only needs no extra masking
+            stamp = stamp_scratch
+            stamp.fill(0)
+            if integer_scale:
+                blit_scaled(stamp, pixels, int(round(scale)), ox, oy, chroma_rgb())
+            else:
+                blit_stamp(stamp, pixels, ox, oy)
+            editor._stamp_pixels(np_to_pixels(stamp))
             try:
                 page.close(dlg)
             except Exception:
@@ -1161,18 +1064,13 @@ def open_image_stamp_dialog(editor, e):
                     except Exception:
                         pass
                 # update files and option_map using absolute paths
+                deleted = {os.path.abspath(x) for x in files_list}
                 try:
-                    abs_list = [os.path.abspath(x) for x in files_list]
-                    for fdel in abs_list:
-                        if fdel in files:
-                            try:
-                                files.remove(fdel)
-                            except Exception:
-                                pass
+                    files[:] = [f for f in files if f not in deleted]
                 except Exception:
                     pass
                 try:
-                    keys_to_remove = [k2 for k2, v2 in list(option_map.items()) if v2 and os.path.abspath(v2) in [os.path.abspath(x) for x in files_list]]
+                    keys_to_remove = [k2 for k2, v2 in list(option_map.items()) if v2 and os.path.abspath(v2) in deleted]
                     for k2 in keys_to_remove:
                         option_map.pop(k2, None)
                 except Exception:
@@ -1209,9 +1107,30 @@ def open_image_stamp_dialog(editor, e):
         except Exception:
             pass
 
-    pos_x.on_change = lambda ev: on_select(None)
-    pos_y.on_change = lambda ev: on_select(None)
-    scale_dropdown.on_change = lambda ev: on_select(None)
+    preview_timer = None
+
+    def schedule_preview(delay=0.12):
+        # collapse bursts of keystrokes into a single preview rebuild; every trigger comes
+        # through here (toggles with delay=0), so a newer one supersedes any pending rebuild
+        nonlocal preview_timer
+        if preview_timer:
+            preview_timer.cancel()
+            preview_timer = None
+        run_thread = getattr(page, 'run_thread', None)
+        post = (lambda: run_thread(on_select, None)) if run_thread else (lambda: on_select(None))
+        if delay <= 0:
+            post()
+            return
+        preview_timer = threading.Timer(delay, post)
+        preview_timer.start()
+
+    def on_scale_change(ev):
+        update_stamp_size()
+        schedule_preview()
+
+    pos_x.on_change = lambda ev: schedule_preview()
+    pos_y.on_change = lambda ev: schedule_preview()
+    scale_dropdown.on_change = on_scale_change
 
     logger.debug(f"Stamp dialog initialized: {len(files)} files found, option_map keys: {list(option_map.keys())}")
 
@@ -1235,7 +1154,8 @@ def open_image_stamp_dialog(editor, e):
         try:
             if not dropdown.value and dropdown.options:
                 dropdown.value = dropdown.options[0].text if hasattr(dropdown.options[0], 'text') else getattr(dropdown.options[0], 'key', None) or getattr(dropdown.options[0], 'value', None)
-            on_select(None)
+            update_stamp_size()
+            schedule_preview(0)
         except Exception:
             pass
 
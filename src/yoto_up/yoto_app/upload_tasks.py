@@ -208,6 +208,22 @@ async def start_uploads(event, ctx):
     status.value = "Starting..."
     page.update()
 
+    # Gains set in the waveform dialog are only recorded there; encode those files now
+    if any(info.get('dirty') for info in gain_adjusted_files.values()):
+        from yoto_up.yoto_app.show_waveforms import save_pending_gain_adjustments
+        status.value = "Saving gain-adjusted audio..."
+        page.update()
+        gain_errors = await asyncio.to_thread(
+            save_pending_gain_adjustments,
+            gain_adjusted_files,
+            ctx.get('waveform_cache', {}),
+            ctx.get('audio_adjust_utils'),
+        )
+        if gain_errors:
+            show_snack(f"Uploading original audio for: {'; '.join(gain_errors)}", error=True)
+        status.value = "Starting..."
+        page.update()
+
     # Option: strip leading track numbers from filenames when used as titles
     strip_leading = bool(ctx.get('strip_leading_track_numbers', True))
     # Option: normalize audio loudness prior to upload (maps to API loudnorm flag)